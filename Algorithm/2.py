@@ -1,3 +1,6 @@
+import bisect
+import random
+
 activities_data = [
     ('A', 1, 4),
     ('B', 3, 5),
@@ -25,12 +28,216 @@ def activity_selector(data, sort_key):
             
     return selected_activities
 
-selected_v1 = activity_selector(activities_data, 2)
-print("--- Versi 1: Finish Time ---")
-print(f"Aktivitas Terpilih: {', '.join(selected_v1)}")
-print(f"Jumlah Aktivitas: {len(selected_v1)}")
 
-selected_v2 = activity_selector(activities_data, 3)
-print("\n--- Versi 2: Duration ---")
-print(f"Aktivitas Terpilih: {', '.join(selected_v2)}")
-print(f"Jumlah Aktivitas: {len(selected_v2)}")
+class TreapNode:
+    # Treap node ordered by key = (finish, start, seq); max_start is the
+    # largest start time in this subtree
+    __slots__ = ("key", "name", "start", "finish", "weight", "priority", "left", "right", "max_start")
+
+    def __init__(self, key, name, start, finish, weight):
+        self.key = key
+        self.name = name
+        self.start = start
+        self.finish = finish
+        self.weight = weight
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+        self.max_start = start
+
+
+def update_node(node):
+    node.max_start = node.start
+    if node.left is not None and node.left.max_start > node.max_start:
+        node.max_start = node.left.max_start
+    if node.right is not None and node.right.max_start > node.max_start:
+        node.max_start = node.right.max_start
+
+
+def treap_split(node, key):
+    # Returns (nodes with key < key, nodes with key >= key)
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = treap_split(node.right, key)
+        update_node(node)
+        return node, right
+    left, node.left = treap_split(node.left, key)
+    update_node(node)
+    return left, node
+
+
+def treap_merge(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = treap_merge(left.right, right)
+        update_node(left)
+        return left
+    right.left = treap_merge(left, right.left)
+    update_node(right)
+    return right
+
+
+def treap_delete(node, key):
+    if node.key == key:
+        return treap_merge(node.left, node.right)
+    if key < node.key:
+        node.left = treap_delete(node.left, key)
+    else:
+        node.right = treap_delete(node.right, key)
+    update_node(node)
+    return node
+
+
+def first_compatible(node, after, earliest_start):
+    # Leftmost node with key > after and start >= earliest_start
+    if node is None or node.max_start < earliest_start:
+        return None
+    if after is not None and node.key <= after:
+        return first_compatible(node.right, after, earliest_start)
+    found = first_compatible(node.left, after, earliest_start)
+    if found is not None:
+        return found
+    if node.start >= earliest_start:
+        return node
+    return first_compatible(node.right, after, earliest_start)
+
+
+def in_order(node):
+    stack = []
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+class IntervalScheduler:
+    """
+    Incremental version of activity_selector (sorted by finish time).
+
+    Intervals live in a treap keyed by finish time, so add() and remove()
+    are O(log n). The greedy selection is cached: a change at finish time f
+    only drops the cached choices from f onwards, and selected() continues
+    the greedy walk from there in O(log n) per chosen interval.
+    """
+
+    def __init__(self, activities=()):
+        self._root = None
+        self._nodes = {}
+        self._seq = 0
+        self._chain = []
+        self._weighted = None
+        for activity in activities:
+            self.add(*activity)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, name):
+        return name in self._nodes
+
+    def add(self, name, start, finish, weight=1):
+        if name in self._nodes:
+            raise ValueError(f"Activity {name!r} already scheduled")
+        if finish < start:
+            raise ValueError("finish must not be before start")
+
+        self._seq += 1
+        node = TreapNode((finish, start, self._seq), name, start, finish, weight)
+        left, right = treap_split(self._root, node.key)
+        self._root = treap_merge(treap_merge(left, node), right)
+        self._nodes[name] = node
+        self._invalidate(node.key)
+
+    def remove(self, name):
+        node = self._nodes.pop(name)
+        self._root = treap_delete(self._root, node.key)
+        self._invalidate(node.key)
+
+    def _invalidate(self, key):
+        # Greedy choices before key do not depend on intervals at or after it
+        keep = len(self._chain)
+        while keep and self._chain[keep - 1].key >= key:
+            keep -= 1
+        del self._chain[keep:]
+        self._weighted = None
+
+    def selected(self):
+        """Names of a maximum set of compatible activities."""
+        chain = self._chain
+        if chain:
+            after, earliest_start = chain[-1].key, chain[-1].finish
+        else:
+            after, earliest_start = None, float("-inf")
+
+        while True:
+            node = first_compatible(self._root, after, earliest_start)
+            if node is None:
+                break
+            chain.append(node)
+            after, earliest_start = node.key, node.finish
+
+        return [node.name for node in chain]
+
+    def max_weight_schedule(self):
+        """
+        Weighted interval scheduling (DP + binary search over finish times).
+        Returns (total_weight, names). The treap is already ordered by finish,
+        so no sorting is needed; the result is cached until the next change.
+        """
+        if self._weighted is not None:
+            return self._weighted
+
+        nodes = list(in_order(self._root))
+        finishes = [node.finish for node in nodes]
+
+        # best[j] = best total weight using the first j intervals
+        best = [0] * (len(nodes) + 1)
+        for j, node in enumerate(nodes):
+            # Last interval (among the first j) finishing by node.start
+            p = bisect.bisect_right(finishes, node.start, 0, j)
+            best[j + 1] = max(best[j], best[p] + node.weight)
+
+        names = []
+        j = len(nodes)
+        while j > 0:
+            node = nodes[j - 1]
+            p = bisect.bisect_right(finishes, node.start, 0, j - 1)
+            if best[j] != best[j - 1]:
+                names.append(node.name)
+                j = p
+            else:
+                j -= 1
+        names.reverse()
+
+        self._weighted = (best[-1], names)
+        return self._weighted
+
+
+if __name__ == "__main__":
+    selected_v1 = activity_selector(activities_data, 2)
+    print("--- Versi 1: Finish Time ---")
+    print(f"Aktivitas Terpilih: {', '.join(selected_v1)}")
+    print(f"Jumlah Aktivitas: {len(selected_v1)}")
+
+    selected_v2 = activity_selector(activities_data, 3)
+    print("\n--- Versi 2: Duration ---")
+    print(f"Aktivitas Terpilih: {', '.join(selected_v2)}")
+    print(f"Jumlah Aktivitas: {len(selected_v2)}")
+
+    scheduler = IntervalScheduler(activities_data)
+    print("\n--- Versi 3: Incremental Scheduler ---")
+    print(f"Aktivitas Terpilih: {', '.join(scheduler.selected())}")
+    scheduler.add('G', 9, 10)
+    scheduler.remove('A')
+    print(f"Setelah tambah G dan hapus A: {', '.join(scheduler.selected())}")
+
+    priority = IntervalScheduler([('X', 0, 6, 10), ('Y', 1, 4, 3), ('Z', 5, 9, 4), ('W', 6, 8, 5)])
+    total, names = priority.max_weight_schedule()
+    print(f"Booking Prioritas: {', '.join(names)} (bobot {total})")
@@ -1,3 +1,9 @@
+import argparse
+import csv
+import heapq
+import math
+from collections import namedtuple
+
 def calculate_sjf_metrics(service_times):
     
     sorted_times = sorted(service_times)
@@ -22,11 +28,243 @@ def calculate_sjf_metrics(service_times):
         "average_time": average_time_in_system
     }
 
-schedule = [5, 10, 3, 8, 2]
 
-sjf_results = calculate_sjf_metrics(schedule)
+Job = namedtuple("Job", ["job_id", "arrival", "service", "priority"], defaults=[0])
+
+CompletedJob = namedtuple("CompletedJob", ["job_id", "arrival", "service", "first_start", "finish"])
+
+POLICIES = ("fcfs", "sjf", "srtf", "priority")
+
+
+class JobState:
+    __slots__ = ("job", "remaining", "first_start", "finish", "token")
+
+    def __init__(self, job):
+        self.job = job
+        self.remaining = job.service
+        self.first_start = None
+        self.finish = None
+        self.token = 0
+
+
+def ready_key(policy, state):
+    if policy in ("sjf", "srtf"):
+        return state.remaining
+    if policy == "priority":
+        return state.job.priority
+    return state.job.arrival
+
+
+def simulate_jobs(jobs, servers=1, policy="sjf"):
+    """
+    Event-driven scheduler simulation. jobs is any iterable of Job in
+    non-decreasing arrival order (it is consumed lazily, so it can stream
+    from a file). Yields a CompletedJob for every job as it finishes.
+
+    Policies: "fcfs", non-preemptive "sjf", preemptive "srtf" (shortest
+    remaining time first) and non-preemptive "priority" (lowest value first).
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    if servers < 1:
+        raise ValueError("servers must be at least 1")
+
+    jobs = iter(jobs)
+    next_job = next(jobs, None)
+
+    ready = []         # (key, arrival, seq, state)
+    completions = []   # (finish, seq, server, state, token) - stale entries are skipped
+    running = {}       # server -> state
+    idle = list(range(servers))
+    seq = 0
+    now = 0
+
+    while next_job is not None or ready or running:
+        # Drop completions of jobs that were preempted
+        while completions:
+            _, _, server, state, token = completions[0]
+            if running.get(server) is state and state.token == token:
+                break
+            heapq.heappop(completions)
+
+        next_finish = completions[0][0] if completions else math.inf
+        next_arrival = next_job.arrival if next_job is not None else math.inf
+
+        if next_finish <= next_arrival:
+            # 1. Completion (handled before an arrival at the same time)
+            now, _, server, _, _ = heapq.heappop(completions)
+            state = running.pop(server)
+            idle.append(server)
+            yield CompletedJob(state.job.job_id, state.job.arrival, state.job.service, state.first_start, now)
+        else:
+            # 2. Arrival
+            if next_arrival < now:
+                raise ValueError("jobs must be sorted by arrival time")
+            now = next_arrival
+            state = JobState(next_job)
+            seq += 1
+            heapq.heappush(ready, (ready_key(policy, state), state.job.arrival, seq, state))
+            next_job = next(jobs, None)
+
+        # 3. Dispatch ready jobs to idle servers, once every job arriving
+        #    at this instant is in the ready queue. Under SRTF a waiting job
+        #    also preempts the running job with the most remaining work, for
+        #    as long as it is shorter than that job.
+        if next_job is not None and next_job.arrival == now:
+            continue
+        while ready and (idle or policy == "srtf"):
+            if idle:
+                server = idle.pop()
+            else:
+                server = max(running, key=lambda s: running[s].finish)
+                victim = running[server]
+                if ready[0][0] >= victim.finish - now:
+                    break
+                victim.remaining = victim.finish - now
+                victim.token += 1
+                seq += 1
+                heapq.heappush(ready, (victim.remaining, victim.job.arrival, seq, victim))
+            state = heapq.heappop(ready)[3]
+            if state.first_start is None:
+                state.first_start = now
+            state.finish = now + state.remaining
+            state.token += 1
+            running[server] = state
+            seq += 1
+            heapq.heappush(completions, (state.finish, seq, server, state, state.token))
+
+
+class LogHistogram:
+    """
+    Streaming histogram with logarithmic buckets. Memory and the cost of a
+    percentile query depend on the range of the values, not on how many were
+    added. Percentiles are accurate to within `precision` (relative error);
+    mean, min and max are exact.
+    """
+
+    def __init__(self, precision=0.005):
+        self.log_base = math.log1p(2 * precision)
+        self.counts = {}   # bucket index -> count, None holds values <= 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        bucket = math.floor(math.log(value) / self.log_base) if value > 0 else None
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, p):
+        # Nearest-rank percentile, reported as the middle of its bucket
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(p / 100 * self.count))
+        if rank >= self.count:
+            return self.max
+        seen = self.counts.get(None, 0)
+        if seen >= rank:
+            return max(self.min, 0)
+        for bucket in sorted(b for b in self.counts if b is not None):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                value = math.exp((bucket + 0.5) * self.log_base)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class LatencyStats:
+    """Collects per-job waiting and turnaround times and reports percentiles."""
+
+    def __init__(self):
+        self.waiting = LogHistogram()
+        self.turnaround = LogHistogram()
+        self.response = LogHistogram()
+        self.last_finish = 0
+
+    def __len__(self):
+        return self.turnaround.count
+
+    def add(self, done):
+        turnaround = done.finish - done.arrival
+        self.turnaround.add(turnaround)
+        self.waiting.add(turnaround - done.service)
+        self.response.add(done.first_start - done.arrival)
+        self.last_finish = max(self.last_finish, done.finish)
+
+    def summary(self, percentiles=(50, 95, 99)):
+        report = {"jobs": len(self), "makespan": self.last_finish}
+        for name in ("waiting", "turnaround", "response"):
+            histogram = getattr(self, name)
+            report[name] = {"mean": histogram.mean()}
+            for p in percentiles:
+                report[name][f"p{p}"] = histogram.percentile(p)
+        return report
+
+
+def read_jobs_csv(path):
+    """
+    Streams Job rows from a CSV file with columns
+    job_id, arrival, service[, priority]. A header row is skipped.
+    """
+    with open(path, newline="") as f:
+        for row in csv.reader(f):
+            if not row:
+                continue
+            try:
+                arrival, service = float(row[1]), float(row[2])
+            except ValueError:
+                continue  # header
+            priority = float(row[3]) if len(row) > 3 and row[3] else 0
+            yield Job(row[0], arrival, service, priority)
+
+
+def run_simulation(jobs, servers=1, policy="sjf", report_every=None, on_report=None):
+    """Runs simulate_jobs, calling on_report(summary) every report_every jobs."""
+    stats = LatencyStats()
+    for done in simulate_jobs(jobs, servers, policy):
+        stats.add(done)
+        if report_every and on_report and len(stats) % report_every == 0:
+            on_report(stats.summary())
+    return stats.summary()
+
+
+def print_report(report):
+    print(f"Jobs selesai: {report['jobs']}, makespan: {report['makespan']:g}")
+    for name in ("waiting", "turnaround", "response"):
+        values = report[name]
+        print(f"  {name:<10} " + "  ".join(f"{k}={v:.3f}" for k, v in values.items()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SJF / SRTF job scheduler simulator")
+    parser.add_argument("trace", nargs="?", help="CSV with job_id,arrival,service[,priority]")
+    parser.add_argument("--servers", type=int, default=1)
+    parser.add_argument("--policy", choices=POLICIES, default="sjf")
+    parser.add_argument("--report-every", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.trace:
+        final = run_simulation(read_jobs_csv(args.trace), args.servers, args.policy,
+                               args.report_every, print_report)
+        print("--- Hasil Akhir ---")
+        print_report(final)
+    else:
+        schedule = [5, 10, 3, 8, 2]
+
+        sjf_results = calculate_sjf_metrics(schedule)
+
+        print("--- Hasil Perhitungan SJF ---")
+        print(f"Urutan Layanan (SJF): {sjf_results['sorted_jobs']}")
+        print(f"Total Waktu dalam Sistem: {sjf_results['total_time']}")
+        print(f"Rata-rata Waktu dalam Sistem: {sjf_results['average_time']}")
 
-print("--- Hasil Perhitungan SJF ---")
-print(f"Urutan Layanan (SJF): {sjf_results['sorted_jobs']}")
-print(f"Total Waktu dalam Sistem: {sjf_results['total_time']}")
-print(f"Rata-rata Waktu dalam Sistem: {sjf_results['average_time']}")
+        print("\n--- Simulasi SRTF (2 server) ---")
+        trace = [Job(i, arrival, service) for i, (arrival, service) in enumerate([(0, 5), (0, 10), (1, 3), (2, 8), (3, 2)])]
+        print_report(run_simulation(trace, servers=2, policy="srtf"))
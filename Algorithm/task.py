@@ -1,3 +1,151 @@
+from array import array
+from functools import lru_cache
+
+# Marks amounts that cannot be formed in a ChangeTable
+UNREACHABLE = -1
+
+
+def greedy_change(amount, coins):
+    """
+    Pure greedy solver. Returns ({coin: count}, remaining_amount); the
+    remaining amount is 0 when the exact amount could be formed.
+    """
+    remaining_amount = amount
+    combination_coins = {}
+
+    for coin in sorted(coins, reverse=True):
+        if remaining_amount >= coin:
+            combination_coins[coin] = remaining_amount // coin
+            remaining_amount %= coin
+
+        if remaining_amount == 0:
+            break
+
+    return combination_coins, remaining_amount
+
+
+def normalize_coins(coins):
+    """Sorted tuple of distinct denominations; all must be positive."""
+    coins = tuple(sorted(set(coins)))
+    if not coins or coins[0] <= 0:
+        raise ValueError("All coin values must be positive.")
+    return coins
+
+
+class ChangeTable:
+    """
+    Bottom-up DP table for one set of denominations. min_coins[a] is the
+    fewest coins that form a (UNREACHABLE if impossible) and last_coin[a]
+    is the coin used last, which is enough to rebuild the combination.
+    Both are compact `array`s that grow on demand, so each amount is only
+    ever computed once.
+    """
+
+    def __init__(self, coins):
+        self.coins = normalize_coins(coins)
+        self.min_coins = array("l", [0])
+        self.last_coin = array("l", [0])
+
+    def extend(self, amount):
+        start = len(self.min_coins)
+        if amount < start:
+            return
+
+        self.min_coins.extend([UNREACHABLE] * (amount + 1 - start))
+        self.last_coin.extend([0] * (amount + 1 - start))
+        min_coins, last_coin = self.min_coins, self.last_coin
+
+        for a in range(start, amount + 1):
+            best = UNREACHABLE
+            best_coin = 0
+            for coin in self.coins:
+                if coin > a:
+                    break
+                previous = min_coins[a - coin]
+                if previous != UNREACHABLE and (best == UNREACHABLE or previous + 1 < best):
+                    best = previous + 1
+                    best_coin = coin
+            min_coins[a] = best
+            last_coin[a] = best_coin
+
+    def count(self, amount):
+        """Fewest coins for amount, or None if it cannot be formed."""
+        self.extend(amount)
+        best = self.min_coins[amount]
+        return None if best == UNREACHABLE else best
+
+    def change(self, amount):
+        """Optimal {coin: count} for amount, or None if it cannot be formed."""
+        if self.count(amount) is None:
+            return None
+
+        combination_coins = {}
+        while amount > 0:
+            coin = self.last_coin[amount]
+            combination_coins[coin] = combination_coins.get(coin, 0) + 1
+            amount -= coin
+        return dict(sorted(combination_coins.items(), reverse=True))
+
+
+@lru_cache(maxsize=32)
+def change_table(coins):
+    """Cached ChangeTable per denomination set (coins must be a tuple)."""
+    return ChangeTable(coins)
+
+
+@lru_cache(maxsize=32)
+def is_canonical(coins):
+    """
+    True if greedy is optimal for every amount with these coins. Uses the
+    Kozen-Zaks bound: if greedy fails anywhere it fails below the sum of the
+    two largest coins. Systems without a 1 coin are treated as non-canonical.
+    """
+    coins = normalize_coins(coins)
+    if coins[0] != 1:
+        return False
+    if len(coins) <= 2:
+        return True
+
+    table = change_table(coins)
+    for amount in range(1, coins[-1] + coins[-2]):
+        combination_coins, _ = greedy_change(amount, coins)
+        if sum(combination_coins.values()) != table.count(amount):
+            return False
+    return True
+
+
+def coin_change(amount, coins):
+    """
+    Optimal change for amount as {coin: count} (largest coin first), or None
+    if the amount cannot be formed. Uses greedy when it is provably optimal
+    for these coins, otherwise the cached DP table.
+    """
+    if amount < 0:
+        raise ValueError("Amount must be non-negative.")
+    coins = normalize_coins(coins)
+
+    if is_canonical(coins):
+        combination_coins, _ = greedy_change(amount, coins)
+        return combination_coins
+    return change_table(coins).change(amount)
+
+
+def coin_change_batch(amounts, coins):
+    """Answers a list of amounts with one pass over the DP table."""
+    if any(amount < 0 for amount in amounts):
+        raise ValueError("Amount must be non-negative.")
+    coins = normalize_coins(coins)
+    if not amounts:
+        return []
+
+    if is_canonical(coins):
+        return [greedy_change(amount, coins)[0] for amount in amounts]
+
+    table = change_table(coins)
+    table.extend(max(amounts))
+    return [table.change(amount) for amount in amounts]
+
+
 def coin_change_greedy():
     """
     Implements the Greedy algorithm for the Coin Change Problem.
@@ -27,24 +175,9 @@ def coin_change_greedy():
             
 
     coins.sort(reverse=True)
-    
-    remaining_amount = amount
-    combination_coins = {}
-    total_coins = 0
-    
-
-    for coin in coins:
-        if remaining_amount >= coin:
-          
-            count = remaining_amount // coin
-            if count > 0:
-                combination_coins[coin] = count
-                remaining_amount -= count * coin
-                total_coins += count
-        
 
-        if remaining_amount == 0:
-            break
+    combination_coins, remaining_amount = greedy_change(amount, coins)
+    total_coins = sum(combination_coins.values())
 
     print("\n--- Results ---")
     if remaining_amount == 0:
@@ -59,4 +192,5 @@ def coin_change_greedy():
         print(f"The exact amount **{amount}** cannot be formed with the given coins. Remaining amount: {remaining_amount}")
 
 
-coin_change_greedy()
\ No newline at end of file
+if __name__ == "__main__":
+    coin_change_greedy()
@@ -0,0 +1,106 @@
+import importlib.util
+import os
+import random
+import unittest
+
+spec = importlib.util.spec_from_file_location(
+    "intervals", os.path.join(os.path.dirname(os.path.abspath(__file__)), "2.py"))
+intervals = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(intervals)
+
+
+def greedy_by_finish(activities):
+    # activities: {name: (start, finish, weight, seq)}; same tie order as the treap key
+    chosen = []
+    last_finish = float("-inf")
+    for name, (start, finish, _, _) in sorted(activities.items(), key=lambda a: (a[1][1], a[1][0], a[1][3])):
+        if start >= last_finish:
+            chosen.append(name)
+            last_finish = finish
+    return chosen
+
+
+def max_weight_quadratic(activities):
+    # O(n^2) DP: best[j] = best weight of a compatible set ending with interval j.
+    # Sorting by start as well puts [x, t] before a zero-length [t, t].
+    items = sorted(activities.values(), key=lambda a: (a[1], a[0]))
+    best = []
+    for start, finish, weight, _ in items:
+        previous = [best[i] for i in range(len(best)) if items[i][1] <= start]
+        best.append(weight + max(previous, default=0))
+    return max(best, default=0)
+
+
+def check_treap(node):
+    # Returns (keys in order, max start), asserting max_start on every node
+    if node is None:
+        return [], float("-inf")
+    left_keys, left_max = check_treap(node.left)
+    right_keys, right_max = check_treap(node.right)
+    assert node.max_start == max(node.start, left_max, right_max)
+    return left_keys + [node.key] + right_keys, node.max_start
+
+
+class TestIntervalScheduler(unittest.TestCase):
+    def assert_compatible(self, activities, names):
+        spans = sorted((activities[name][0], activities[name][1]) for name in names)
+        for (_, finish), (start, _) in zip(spans, spans[1:]):
+            self.assertLessEqual(finish, start)
+
+    def test_random_add_remove_matches_greedy(self):
+        rng = random.Random(1)
+        for _ in range(30):
+            scheduler = intervals.IntervalScheduler()
+            activities = {}
+            seq = 0
+            for step in range(150):
+                if activities and rng.random() < 0.35:
+                    name = rng.choice(sorted(activities))
+                    scheduler.remove(name)
+                    del activities[name]
+                else:
+                    start = rng.randint(0, 50)
+                    finish = start + rng.randint(0, 8)
+                    seq += 1
+                    name = f"a{step}"
+                    scheduler.add(name, start, finish)
+                    activities[name] = (start, finish, 1, seq)
+
+                # Query only sometimes so cached chains survive several changes
+                if rng.random() < 0.3:
+                    self.assertEqual(scheduler.selected(), greedy_by_finish(activities))
+                    keys, _ = check_treap(scheduler._root)
+                    self.assertEqual(keys, sorted(keys))
+                    self.assertEqual(len(keys), len(activities))
+            self.assertEqual(scheduler.selected(), greedy_by_finish(activities))
+
+    def test_weighted_matches_quadratic_dp(self):
+        rng = random.Random(2)
+        for _ in range(60):
+            scheduler = intervals.IntervalScheduler()
+            activities = {}
+            for step in range(rng.randint(0, 40)):
+                start = rng.randint(0, 30)
+                finish = start + rng.randint(0, 10)
+                weight = rng.randint(1, 20)
+                scheduler.add(f"a{step}", start, finish, weight)
+                activities[f"a{step}"] = (start, finish, weight, step)
+            if activities and rng.random() < 0.5:
+                name = rng.choice(sorted(activities))
+                scheduler.remove(name)
+                del activities[name]
+
+            total, names = scheduler.max_weight_schedule()
+            self.assertEqual(total, max_weight_quadratic(activities))
+            self.assertEqual(total, sum(activities[name][2] for name in names))
+            self.assert_compatible(activities, names)
+
+    def test_rejects_duplicates_and_reversed_intervals(self):
+        scheduler = intervals.IntervalScheduler([("A", 1, 4)])
+        self.assertRaises(ValueError, scheduler.add, "A", 5, 6)
+        self.assertRaises(ValueError, scheduler.add, "B", 6, 5)
+        self.assertEqual(len(scheduler), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import importlib.util
+import math
+import os
+import random
+import unittest
+
+spec = importlib.util.spec_from_file_location(
+    "scheduler", os.path.join(os.path.dirname(os.path.abspath(__file__)), "3.py"))
+scheduler = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(scheduler)
+
+Job = scheduler.Job
+
+
+def finish_times(jobs, servers, policy):
+    return {done.job_id: done.finish for done in scheduler.simulate_jobs(jobs, servers, policy)}
+
+
+class TestSimulateJobs(unittest.TestCase):
+    def test_srtf_single_server(self):
+        jobs = [Job("A", 0, 8), Job("B", 1, 4), Job("C", 2, 9), Job("D", 3, 5)]
+        self.assertEqual(finish_times(jobs, 1, "srtf"), {"A": 17, "B": 5, "C": 26, "D": 10})
+
+    def test_srtf_preempts_every_server_on_simultaneous_arrivals(self):
+        jobs = [Job("A", 0, 10), Job("B", 0, 10), Job("C", 1, 1), Job("D", 1, 1)]
+        self.assertEqual(finish_times(jobs, 2, "srtf"), {"A": 11, "B": 11, "C": 2, "D": 2})
+
+    def test_srtf_preempts_only_longer_jobs(self):
+        jobs = [Job("A", 0, 10), Job("B", 0, 2), Job("C", 1, 3), Job("D", 1, 3)]
+        # C preempts A (9 left); D waits for B because B (1 left) is shorter
+        self.assertEqual(finish_times(jobs, 2, "srtf"), {"A": 13, "B": 2, "C": 4, "D": 5})
+
+    def test_sjf_does_not_preempt(self):
+        jobs = [Job("A", 0, 10), Job("B", 0, 10), Job("C", 1, 1), Job("D", 1, 1)]
+        self.assertEqual(finish_times(jobs, 2, "sjf"), {"A": 10, "B": 10, "C": 11, "D": 11})
+
+
+class TestLogHistogram(unittest.TestCase):
+    def test_percentiles_within_precision(self):
+        rng = random.Random(0)
+        values = [rng.expovariate(0.1) for _ in range(20000)] + [0.0] * 500
+        histogram = scheduler.LogHistogram(precision=0.005)
+        for value in values:
+            histogram.add(value)
+        values.sort()
+        for p in (1, 50, 95, 99, 100):
+            exact = values[max(1, math.ceil(p / 100 * len(values))) - 1]
+            self.assertAlmostEqual(histogram.percentile(p), exact, delta=exact * 0.005)
+        self.assertAlmostEqual(histogram.mean(), sum(values) / len(values))
+        self.assertEqual(histogram.percentile(100), values[-1])
+
+    def test_empty(self):
+        histogram = scheduler.LogHistogram()
+        self.assertEqual((histogram.mean(), histogram.percentile(50)), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import argparse
+import random
+import time
+from operator import itemgetter
+
+from mergesort import merge_sort_bottom_up
+from quicksort import intro_sort
+
+
+def make_inputs(n, seed=0):
+    rng = random.Random(seed)
+    scores = [rng.randint(0, 10 ** 6) for _ in range(n)]
+
+    return {
+        "random": [(f"student{i}", s) for i, s in enumerate(scores)],
+        "sorted": [(f"student{i}", s) for i, s in enumerate(sorted(scores))],
+        "reversed": [(f"student{i}", s) for i, s in enumerate(sorted(scores, reverse=True))],
+        # Only 10 distinct scores
+        "duplicates": [(f"student{i}", s % 10) for i, s in enumerate(scores)],
+    }
+
+
+def run_benchmark(n, repeat=3):
+    by_score = itemgetter(1)
+    sorters = {
+        "sorted()": lambda data: sorted(data, key=by_score),
+        "merge_sort_bottom_up": lambda data: merge_sort_bottom_up(data, key=by_score),
+        "intro_sort": lambda data: intro_sort(list(data), key=by_score),
+    }
+
+    print(f"--- Sorting {n} (name, score) records, best of {repeat} ---")
+    print(f"{'input':<12}" + "".join(f"{name:>22}" for name in sorters))
+
+    for input_name, data in make_inputs(n).items():
+        expected = [by_score(row) for row in sorted(data, key=by_score)]
+        row = f"{input_name:<12}"
+
+        for sort in sorters.values():
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = sort(data)
+                best = min(best, time.perf_counter() - start)
+
+            # intro_sort is not stable, so compare the scores only
+            assert [by_score(r) for r in result] == expected
+            row += f"{best:>21.3f}s"
+
+        print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the sort engines with sorted().")
+    parser.add_argument("-n", type=int, default=100000, help="number of records")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run_benchmark(args.n, args.repeat)
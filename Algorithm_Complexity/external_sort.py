@@ -0,0 +1,122 @@
+import heapq
+import os
+import random
+import struct
+import tempfile
+from operator import itemgetter
+
+from mergesort import merge_sort_bottom_up
+
+# Record layout in a run file:
+#   name length (uint16) | score tag (1 byte) | score (8 bytes) | name (utf-8)
+HEADER = struct.Struct("<Hc8s")
+INT_SCORE = b"i"
+FLOAT_SCORE = b"d"
+INT64 = struct.Struct("<q")
+FLOAT64 = struct.Struct("<d")
+
+
+def write_record(out, name, score):
+    encoded = name.encode("utf-8")
+    if isinstance(score, int):
+        tag, raw = INT_SCORE, INT64.pack(score)
+    else:
+        tag, raw = FLOAT_SCORE, FLOAT64.pack(score)
+    out.write(HEADER.pack(len(encoded), tag, raw))
+    out.write(encoded)
+
+
+def read_records(path, buffer_size):
+    """Lazily yields (name, score) records from one run file."""
+    with open(path, "rb", buffering=buffer_size) as run:
+        while True:
+            header = run.read(HEADER.size)
+            if not header:
+                return
+            length, tag, raw = HEADER.unpack(header)
+            score = INT64.unpack(raw)[0] if tag == INT_SCORE else FLOAT64.unpack(raw)[0]
+            yield run.read(length).decode("utf-8"), score
+
+
+def write_run(records, work_dir, buffer_size):
+    fd, path = tempfile.mkstemp(suffix=".run", dir=work_dir)
+    with os.fdopen(fd, "wb", buffering=buffer_size) as out:
+        for name, score in records:
+            write_record(out, name, score)
+    return path
+
+
+def merge_runs(paths, buffer_size):
+    """
+    K-way merge of sorted run files with a heap. Only one record per run is
+    held in memory. Ties are broken by run index, which keeps the merge stable.
+    """
+    readers = [read_records(path, buffer_size) for path in paths]
+    heap = []
+    for index, reader in enumerate(readers):
+        for name, score in reader:
+            heap.append((score, index, name))
+            break
+    heapq.heapify(heap)
+
+    while heap:
+        score, index, name = heap[0]
+        yield name, score
+
+        # Refill from the same run, or drop it once it is exhausted
+        for next_name, next_score in readers[index]:
+            heapq.heapreplace(heap, (next_score, index, next_name))
+            break
+        else:
+            heapq.heappop(heap)
+
+
+def external_sort(records, run_size=100000, max_fan_in=64, tmp_dir=None, buffer_size=1 << 16):
+    """
+    Sorts (name, score) records by score without holding them all in memory.
+
+    records can be any iterable (e.g. a generator over a file). Every run_size
+    records are sorted with merge_sort_bottom_up and written to a temporary
+    run file; runs are then k-way merged, at most max_fan_in at a time. The
+    result is a lazy iterator: records are yielded as soon as the final merge
+    starts, and the temporary files are removed when it is exhausted or closed.
+    """
+    if max_fan_in < 2:
+        raise ValueError("max_fan_in must be at least 2")
+
+    by_score = itemgetter(1)
+    with tempfile.TemporaryDirectory(prefix="external_sort_", dir=tmp_dir) as work_dir:
+        # 1. Split the input into sorted runs
+        runs = []
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= run_size:
+                runs.append(write_run(merge_sort_bottom_up(chunk, key=by_score), work_dir, buffer_size))
+                chunk = []
+        if chunk or not runs:
+            runs.append(write_run(merge_sort_bottom_up(chunk, key=by_score), work_dir, buffer_size))
+        del chunk
+
+        # 2. Merge groups of runs until a single merge pass is left
+        while len(runs) > max_fan_in:
+            merged = []
+            for start in range(0, len(runs), max_fan_in):
+                group = runs[start:start + max_fan_in]
+                merged.append(write_run(merge_runs(group, buffer_size), work_dir, buffer_size))
+                for path in group:
+                    os.remove(path)
+            runs = merged
+
+        # 3. Final merge streams straight to the caller
+        yield from merge_runs(runs, buffer_size)
+
+
+if __name__ == "__main__":
+    def generate_students(count):
+        for i in range(count):
+            yield f"student{i}", random.randint(0, 100)
+
+    print("--- External Merge Sort ---")
+    for name, score in external_sort(generate_students(20), run_size=6):
+        print(name, score)
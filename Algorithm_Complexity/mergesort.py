@@ -24,9 +24,78 @@ def merge_sort_simple(arr):
     merged.extend(right[j:])
     return merged
 
-students = [("Andi", 78), ("Budi", 65), ("Citra", 85), ("Dewi", 72), ("Eka", 90)]
-sorted_students_merge = merge_sort_simple(students)
 
-print("--- Merge Sort Simple ---")
-print("Original List:", students)
-print("Sorted List:", sorted_students_merge)
\ No newline at end of file
+# Runs shorter than this are sorted with insertion sort before merging
+MIN_RUN = 32
+
+
+def merge_sort_bottom_up(arr, key=None):
+    """
+    Stable, non-recursive merge sort. Merges runs of doubling width back and
+    forth between the working list and one scratch buffer that is allocated
+    once, so merging allocates no new lists per run; only the leftover tail
+    of each merge is copied with a slice assignment. Returns a new sorted
+    list.
+    """
+    n = len(arr)
+    items = list(arr)
+    keys = list(items) if key is None else [key(item) for item in items]
+
+    # 1. Sort small runs in place with insertion sort
+    for start in range(0, n, MIN_RUN):
+        end = min(start + MIN_RUN, n)
+        for i in range(start + 1, end):
+            item, k = items[i], keys[i]
+            j = i - 1
+            while j >= start and keys[j] > k:
+                items[j + 1] = items[j]
+                keys[j + 1] = keys[j]
+                j -= 1
+            items[j + 1] = item
+            keys[j + 1] = k
+
+    # 2. Merge neighbouring runs, swapping source and scratch after each pass
+    scratch_items = [None] * n
+    scratch_keys = [None] * n
+    width = MIN_RUN
+    while width < n:
+        for left in range(0, n, 2 * width):
+            mid = min(left + width, n)
+            right = min(left + 2 * width, n)
+            i, j, out = left, mid, left
+
+            while i < mid and j < right:
+                # "<=" keeps equal keys in their original order
+                if keys[i] <= keys[j]:
+                    scratch_items[out] = items[i]
+                    scratch_keys[out] = keys[i]
+                    i += 1
+                else:
+                    scratch_items[out] = items[j]
+                    scratch_keys[out] = keys[j]
+                    j += 1
+                out += 1
+
+            # Copy whichever side is left over
+            if i < mid:
+                scratch_items[out:right] = items[i:mid]
+                scratch_keys[out:right] = keys[i:mid]
+            else:
+                scratch_items[out:right] = items[j:right]
+                scratch_keys[out:right] = keys[j:right]
+
+        items, scratch_items = scratch_items, items
+        keys, scratch_keys = scratch_keys, keys
+        width *= 2
+
+    return items
+
+
+if __name__ == "__main__":
+    students = [("Andi", 78), ("Budi", 65), ("Citra", 85), ("Dewi", 72), ("Eka", 90)]
+    sorted_students_merge = merge_sort_simple(students)
+
+    print("--- Merge Sort Simple ---")
+    print("Original List:", students)
+    print("Sorted List:", sorted_students_merge)
+    print("Sorted List (bottom-up):", merge_sort_bottom_up(students, key=lambda student: student[1]))
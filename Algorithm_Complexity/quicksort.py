@@ -23,9 +23,122 @@ def quick_sort_simple(arr):
     # 3. Conquer (Recursive Call) and Combine
     return quick_sort_simple(less) + equal + quick_sort_simple(greater)
 
-students_quick = [("Andi", 78), ("Budi", 65), ("Citra", 85), ("Dewi", 72), ("Eka", 90)]
-sorted_students_quick = quick_sort_simple(students_quick)
 
-print("\n--- Quick Sort Simple ---")
-print("Original List:", students_quick)
-print("Sorted List:", sorted_students_quick)
\ No newline at end of file
+# Ranges of this size or smaller are finished with insertion sort
+INSERTION_THRESHOLD = 16
+
+
+def swap(items, keys, i, j):
+    items[i], items[j] = items[j], items[i]
+    keys[i], keys[j] = keys[j], keys[i]
+
+
+def insertion_sort_range(items, keys, lo, hi):
+    # Sorts items[lo:hi + 1]
+    for i in range(lo + 1, hi + 1):
+        item, k = items[i], keys[i]
+        j = i - 1
+        while j >= lo and keys[j] > k:
+            items[j + 1] = items[j]
+            keys[j + 1] = keys[j]
+            j -= 1
+        items[j + 1] = item
+        keys[j + 1] = k
+
+
+def heap_sort_range(items, keys, lo, hi):
+    # Sorts items[lo:hi + 1]; used when quicksort goes too deep
+    n = hi - lo + 1
+
+    def sift_down(root, end):
+        while True:
+            child = 2 * root + 1
+            if child >= end:
+                return
+            if child + 1 < end and keys[lo + child] < keys[lo + child + 1]:
+                child += 1
+            if keys[lo + root] >= keys[lo + child]:
+                return
+            swap(items, keys, lo + root, lo + child)
+            root = child
+
+    for root in range(n // 2 - 1, -1, -1):
+        sift_down(root, n)
+    for end in range(n - 1, 0, -1):
+        swap(items, keys, lo, lo + end)
+        sift_down(0, end)
+
+
+def partition(items, keys, lo, hi):
+    # 1. Median-of-three pivot, moved to items[lo]
+    mid = (lo + hi) // 2
+    if keys[mid] < keys[lo]:
+        swap(items, keys, mid, lo)
+    if keys[hi] < keys[lo]:
+        swap(items, keys, hi, lo)
+    if keys[hi] < keys[mid]:
+        swap(items, keys, hi, mid)
+    swap(items, keys, lo, mid)
+    pivot = keys[lo]
+
+    # 2. Hoare partition: equal keys stop both scans, so all-equal input
+    #    is split in the middle instead of degrading to O(n^2)
+    i, j = lo, hi + 1
+    while True:
+        i += 1
+        while keys[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < keys[j]:
+            j -= 1
+        if i >= j:
+            break
+        swap(items, keys, i, j)
+
+    swap(items, keys, lo, j)
+    return j
+
+
+def intro_sort(arr, key=None):
+    """
+    In-place introsort: quicksort with a median-of-three pivot, heapsort once
+    the depth exceeds 2*log2(n), and insertion sort for small ranges. Uses an
+    explicit stack instead of recursion. Not stable. Returns arr.
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    keys = list(arr) if key is None else [key(item) for item in arr]
+
+    stack = [(0, n - 1, 2 * n.bit_length())]
+
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo + 1 > INSERTION_THRESHOLD:
+            if depth == 0:
+                heap_sort_range(arr, keys, lo, hi)
+                break
+            depth -= 1
+            p = partition(arr, keys, lo, hi)
+
+            # Loop on the smaller side so the stack stays O(log n)
+            if p - lo < hi - p:
+                stack.append((p + 1, hi, depth))
+                hi = p - 1
+            else:
+                stack.append((lo, p - 1, depth))
+                lo = p + 1
+        else:
+            insertion_sort_range(arr, keys, lo, hi)
+
+    return arr
+
+
+if __name__ == "__main__":
+    students_quick = [("Andi", 78), ("Budi", 65), ("Citra", 85), ("Dewi", 72), ("Eka", 90)]
+    sorted_students_quick = quick_sort_simple(students_quick)
+
+    print("\n--- Quick Sort Simple ---")
+    print("Original List:", students_quick)
+    print("Sorted List:", sorted_students_quick)
+    print("Sorted List (introsort):", intro_sort(list(students_quick), key=lambda student: student[1]))
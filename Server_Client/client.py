@@ -1,14 +1,16 @@
 # client.py
 import socket
 import threading
-import time
+
+from protocol import FrameReader, send_frame
 
 def receive_messages(client_socket):
     """Thread function to continuously receive messages from server"""
+    frames = FrameReader(client_socket)
     while True:
         try:
-            message = client_socket.recv(1024).decode('utf-8')
-            if not message:
+            message = frames.read_frame()
+            if message is None:
                 print("\nServer disconnected")
                 break
             print(f"\nServer says: {message}")
@@ -43,15 +45,12 @@ def start_client():
             message = input("You: ")
             
             if message.lower() == 'quit':
-                client_socket.send("quit".encode('utf-8'))
+                send_frame(client_socket, "quit")
                 print("Disconnecting from server...")
                 break
                 
-            # Send message to server
-            client_socket.send(message.encode('utf-8'))
-            
-            # Small delay to prevent flooding
-            time.sleep(0.1)
+            # Send message to server as one frame
+            send_frame(client_socket, message)
             
     except ConnectionRefusedError:
         print(f"Could not connect to server at {host}:{port}.")
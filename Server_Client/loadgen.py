@@ -0,0 +1,118 @@
+# loadgen.py
+"""
+Load generator for the async chat server (python server.py --mode async).
+
+Opens pairs of clients, puts every pair in its own room and lets both sides
+send timestamped messages to each other. Reports delivered messages per
+second and end-to-end latency percentiles.
+"""
+import argparse
+import asyncio
+import math
+import time
+
+from protocol import read_frame_async, write_frames_async
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class LoadClient:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.received = 0
+        self.progress = asyncio.Event()
+        self.latencies = []
+
+    async def expect(self, prefix):
+        # Skip frames until one starts with prefix (e.g. the /join reply)
+        while True:
+            message = await read_frame_async(self.reader)
+            if message is None:
+                raise ConnectionError("Server closed the connection")
+            if message.startswith(prefix):
+                return
+
+    async def receive(self, count):
+        while self.received < count:
+            message = await read_frame_async(self.reader)
+            if message is None:
+                raise ConnectionError("Server closed the connection")
+            # "[room] Client #N: <sent_ns>|<padding>"
+            sent_ns = int(message.split(': ', 1)[1].split('|', 1)[0])
+            self.latencies.append((time.perf_counter_ns() - sent_ns) / 1e6)
+            self.received += 1
+            self.progress.set()
+
+    async def send(self, peer, count, size, batch, window):
+        padding = 'x' * size
+        sent = 0
+        while sent < count:
+            # Flow control: never get more than `window` messages ahead of
+            # the peer, so the server's per-client queue never overflows
+            while sent - peer.received >= window:
+                peer.progress.clear()
+                await peer.progress.wait()
+
+            n = min(batch, count - sent, window - (sent - peer.received))
+            write_frames_async(self.writer, [f"{time.perf_counter_ns()}|{padding}" for _ in range(n)])
+            await self.writer.drain()
+            sent += n
+
+
+async def run_load(host, port, pairs, messages, size, batch, window):
+    clients = []
+    for i in range(pairs * 2):
+        reader, writer = await asyncio.open_connection(host, port)
+        client = LoadClient(reader, writer)
+        write_frames_async(writer, [f"/join load-{i // 2}"])
+        clients.append(client)
+    await asyncio.gather(*(client.expect("Joined room") for client in clients))
+
+    start = time.perf_counter()
+    tasks = []
+    for a, b in zip(clients[::2], clients[1::2]):
+        tasks += [
+            a.send(b, messages, size, batch, window),
+            b.send(a, messages, size, batch, window),
+            a.receive(messages),
+            b.receive(messages),
+        ]
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    for client in clients:
+        client.writer.close()
+
+    latencies = sorted(l for client in clients for l in client.latencies)
+    return {
+        "messages": len(latencies),
+        "seconds": elapsed,
+        "messages_per_second": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chat server load generator")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=12346)
+    parser.add_argument('--pairs', type=int, default=50, help="number of client pairs")
+    parser.add_argument('--messages', type=int, default=2000, help="messages sent by each client")
+    parser.add_argument('--size', type=int, default=64, help="padding bytes per message")
+    parser.add_argument('--batch', type=int, default=16, help="frames per write")
+    parser.add_argument('--window', type=int, default=64, help="max unacknowledged messages per client")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_load(args.host, args.port, args.pairs, args.messages,
+                                  args.size, args.batch, args.window))
+    print(f"--- {result['messages']} messages in {result['seconds']:.2f}s ---")
+    print(f"Throughput: {result['messages_per_second']:.0f} msgs/s")
+    print(f"Latency: p50={result['p50_ms']:.2f}ms  p95={result['p95_ms']:.2f}ms  p99={result['p99_ms']:.2f}ms")
@@ -0,0 +1,164 @@
+# protocol.py
+"""
+Length-prefixed wire protocol shared by server.py and client.py.
+
+Every message is one frame:
+
+    +----------------+-----------+-------------------+
+    | length (4 B)   | flags (1) | payload (length)  |
+    +----------------+-----------+-------------------+
+
+length is the payload size in network byte order. If FLAG_ZLIB is set the
+payload is zlib-compressed UTF-8, otherwise plain UTF-8. Because a frame
+always carries its full size, long messages are never split and multi-byte
+characters are never cut in half.
+"""
+import asyncio
+import struct
+import zlib
+
+HEADER = struct.Struct('!IB')
+FLAG_ZLIB = 0x01
+
+# Payloads at least this big are compressed
+COMPRESS_THRESHOLD = 1024
+# Refuse frames bigger than this (protects against garbage length prefixes)
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+# Linux IOV_MAX; sendmsg() rejects more buffers than this in one call
+MAX_IOV = 1024
+
+
+class ProtocolError(ValueError):
+    pass
+
+
+def encode_frame(message, compress_threshold=COMPRESS_THRESHOLD):
+    """Returns (header, payload) for a str or bytes message."""
+    payload = message.encode('utf-8') if isinstance(message, str) else bytes(message)
+    flags = 0
+    if compress_threshold is not None and len(payload) >= compress_threshold:
+        compressed = zlib.compress(payload)
+        if len(compressed) < len(payload):
+            payload, flags = compressed, FLAG_ZLIB
+    if len(payload) > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame of {len(payload)} bytes exceeds MAX_FRAME_SIZE")
+    return HEADER.pack(len(payload), flags), payload
+
+
+def decode_payload(flags, payload):
+    if flags & FLAG_ZLIB:
+        decompressor = zlib.decompressobj()
+        payload = decompressor.decompress(payload, MAX_FRAME_SIZE)
+        if decompressor.unconsumed_tail:
+            raise ProtocolError("Decompressed frame exceeds MAX_FRAME_SIZE")
+    # Invalid UTF-8 from a misbehaving client must not end the connection
+    return str(payload, 'utf-8', errors='replace')
+
+
+def send_frames(sock, messages, compress_threshold=COMPRESS_THRESHOLD):
+    """
+    Sends several messages with as few system calls as possible: all headers
+    and payloads go out through sendmsg() (writev) in one batch, or through
+    one sendall() where sendmsg() is not available.
+    """
+    buffers = []
+    for message in messages:
+        buffers.extend(encode_frame(message, compress_threshold))
+
+    views = [memoryview(b) for b in buffers if b]
+    if not hasattr(sock, 'sendmsg'):
+        # Windows sockets have no sendmsg(); send one joined buffer instead
+        sock.sendall(b"".join(views))
+        return
+    first = 0
+    while first < len(views):
+        sent = sock.sendmsg(views[first:first + MAX_IOV])
+        # Skip the buffers that went out completely, trim a partial one
+        while first < len(views) and sent >= len(views[first]):
+            sent -= len(views[first])
+            first += 1
+        if sent:
+            views[first] = views[first][sent:]
+
+
+def send_frame(sock, message, compress_threshold=COMPRESS_THRESHOLD):
+    send_frames(sock, [message], compress_threshold)
+
+
+class FrameReader:
+    """
+    Reads frames from a blocking socket with recv_into() on one preallocated
+    buffer. Frames are parsed in place through a memoryview, so bytes are
+    only copied when they are decoded into the final str.
+    """
+
+    def __init__(self, sock, buffer_size=64 * 1024):
+        self.sock = sock
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.start = 0   # first unparsed byte
+        self.end = 0     # end of received data
+
+    def _compact(self, needed):
+        # Move the unparsed tail to the front, growing the buffer if needed
+        pending = self.end - self.start
+        if needed > len(self.buffer):
+            self.view.release()
+            self.buffer = self.buffer[self.start:self.end] + bytearray(needed - pending)
+            self.view = memoryview(self.buffer)
+        elif self.start:
+            self.view[:pending] = self.view[self.start:self.end]
+        self.start, self.end = 0, pending
+
+    def _fill(self, needed):
+        # Receive until at least `needed` unparsed bytes are buffered
+        if self.start + needed > len(self.buffer):
+            self._compact(needed)
+        while self.end - self.start < needed:
+            received = self.sock.recv_into(self.view[self.end:])
+            if not received:
+                return False
+            self.end += received
+        return True
+
+    def read_frame(self):
+        """Returns the next message as str, or None when the peer closed."""
+        if not self._fill(HEADER.size):
+            return None
+        length, flags = HEADER.unpack_from(self.buffer, self.start)
+        if length > MAX_FRAME_SIZE:
+            raise ProtocolError(f"Frame of {length} bytes exceeds MAX_FRAME_SIZE")
+
+        if not self._fill(HEADER.size + length):
+            return None
+        payload_start = self.start + HEADER.size
+        payload = self.view[payload_start:payload_start + length]
+        try:
+            return decode_payload(flags, payload)
+        finally:
+            payload.release()
+            self.start = payload_start + length
+            if self.start == self.end:
+                self.start = self.end = 0
+
+
+# --- asyncio streams ---
+async def read_frame_async(reader):
+    """Returns the next message as str, or None when the peer closed."""
+    try:
+        header = await reader.readexactly(HEADER.size)
+        length, flags = HEADER.unpack(header)
+        if length > MAX_FRAME_SIZE:
+            raise ProtocolError(f"Frame of {length} bytes exceeds MAX_FRAME_SIZE")
+        payload = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        return None
+    return decode_payload(flags, payload)
+
+
+def write_frames_async(writer, messages, compress_threshold=COMPRESS_THRESHOLD):
+    """Queues several frames with one writelines() call (writev underneath)."""
+    buffers = []
+    for message in messages:
+        buffers.extend(encode_frame(message, compress_threshold))
+    writer.writelines(buffers)
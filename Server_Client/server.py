@@ -1,16 +1,22 @@
 # server.py
+import argparse
+import asyncio
 import socket
 import threading
+import zlib
+
+from protocol import FrameReader, ProtocolError, read_frame_async, send_frame, write_frames_async
 
 def handle_client(client_socket, client_address, client_id):
     print(f"\n=== Client #{client_id} connected from {client_address} ===")
+    frames = FrameReader(client_socket)
     
     try:
         while True:
             # Receive message from client
-            message = client_socket.recv(1024).decode('utf-8')
+            message = frames.read_frame()
             
-            if not message:
+            if message is None:
                 print(f"Client #{client_id} disconnected")
                 break
                 
@@ -24,11 +30,11 @@ def handle_client(client_socket, client_address, client_id):
             server_response = input(f"Reply to Client #{client_id}: ")
             
             if server_response.lower() == 'quit':
-                client_socket.send("Server is shutting down. Goodbye!".encode('utf-8'))
+                send_frame(client_socket, "Server is shutting down. Goodbye!")
                 break
                 
             # Send server's response back to client
-            client_socket.send(server_response.encode('utf-8'))
+            send_frame(client_socket, server_response)
             print(f"Sent to Client #{client_id}: {server_response}")
             
     except ConnectionResetError:
@@ -39,20 +45,16 @@ def handle_client(client_socket, client_address, client_id):
         client_socket.close()
         print(f"=== Connection with Client #{client_id} closed ===\n")
 
-def start_server():
+def start_server(host='localhost', port=12346, backlog=5):
     # Create a socket object
     server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     
-    # Server configuration
-    host = 'localhost'
-    port = 12346
-    
     # Bind the socket to the address and port
     server_socket.bind((host, port))
     
     # Listen for incoming connections
-    server_socket.listen(5)
+    server_socket.listen(backlog)
     print(f"=== Chat Server started on {host}:{port} ===")
     print("Waiting for incoming connections...")
     print("Type 'quit' to stop the server\n")
@@ -82,5 +84,214 @@ def start_server():
         server_socket.close()
         print("Server socket closed")
 
+class ChatClient:
+    """One connected client in the asyncio server."""
+
+    def __init__(self, client_id, reader, writer, queue_size):
+        self.client_id = client_id
+        self.reader = reader
+        self.writer = writer
+        self.address = writer.get_extra_info('peername')
+        self.room = None
+        # Bounded so one slow reader cannot make the server buffer forever
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.writer_task = None
+
+
+class AsyncChatServer:
+    """
+    Event-loop chat server: every connection is a pair of coroutines
+    (reader + writer) instead of a thread, so thousands of idle clients
+    cost almost nothing. Clients talk in broadcast rooms; the operator uses
+    a non-blocking admin console.
+
+    Client commands: /join <room>, /rooms, quit.
+    Admin commands:  /list, /say <msg>, /msg <id> <msg>, /kick <id>, quit.
+    """
+
+    def __init__(self, host='localhost', port=12346, backlog=1024, queue_size=100,
+                 default_room='lobby'):
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.queue_size = queue_size
+        self.default_room = default_room
+        self.clients = {}
+        self.rooms = {}
+        self.client_count = 0
+        self.server = None
+
+    # --- Rooms ---
+    def join(self, client, room):
+        self.leave(client)
+        client.room = room
+        self.rooms.setdefault(room, set()).add(client)
+
+    def leave(self, client):
+        members = self.rooms.get(client.room)
+        if members is not None:
+            members.discard(client)
+            if not members:
+                del self.rooms[client.room]
+        client.room = None
+
+    # --- Sending ---
+    def send(self, client, message):
+        try:
+            client.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Backpressure: drop clients that stop reading instead of
+            # letting their queue (and our memory) grow without bound
+            print(f"Client #{client.client_id} is too slow, disconnecting")
+            self.disconnect(client)
+
+    def broadcast(self, room, message, sender=None):
+        for member in list(self.rooms.get(room, ())):
+            if member is not sender:
+                self.send(member, message)
+
+    def disconnect(self, client):
+        if self.clients.pop(client.client_id, None) is None:
+            return
+        self.leave(client)
+        if client.writer_task is not None:
+            client.writer_task.cancel()
+        client.writer.close()
+
+    async def write_loop(self, client):
+        try:
+            while True:
+                # Send everything queued so far as one batch of frames
+                batch = [await client.queue.get()]
+                while not client.queue.empty():
+                    batch.append(client.queue.get_nowait())
+                write_frames_async(client.writer, batch)
+                # Wait for the socket buffer to drain before taking more
+                await client.writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        except ProtocolError as e:
+            print(f"Could not send to Client #{client.client_id}: {e}")
+        finally:
+            self.disconnect(client)
+
+    # --- Connections ---
+    async def handle_client(self, reader, writer):
+        self.client_count += 1
+        client = ChatClient(self.client_count, reader, writer, self.queue_size)
+        self.clients[client.client_id] = client
+        client.writer_task = asyncio.create_task(self.write_loop(client))
+        self.join(client, self.default_room)
+        print(f"=== Client #{client.client_id} connected from {client.address} ===")
+
+        try:
+            while client.client_id in self.clients:
+                message = await read_frame_async(reader)
+                if message is None:
+                    print(f"Client #{client.client_id} disconnected")
+                    break
+
+                message = message.strip()
+                if message.lower() == 'quit':
+                    print(f"Client #{client.client_id} requested to quit")
+                    break
+                self.handle_message(client, message)
+        except ConnectionResetError:
+            print(f"Client #{client.client_id} disconnected unexpectedly")
+        except (ProtocolError, zlib.error) as e:
+            print(f"Client #{client.client_id} sent a malformed frame: {e}")
+        finally:
+            self.disconnect(client)
+
+    def handle_message(self, client, message):
+        if message.startswith('/join '):
+            room = message[len('/join '):].strip() or self.default_room
+            self.join(client, room)
+            self.send(client, f"Joined room '{room}'")
+        elif message == '/rooms':
+            self.send(client, "Rooms: " + ", ".join(f"{r} ({len(m)})" for r, m in self.rooms.items()))
+        elif message:
+            self.broadcast(client.room, f"[{client.room}] Client #{client.client_id}: {message}", sender=client)
+
+    # --- Admin console ---
+    async def admin_console(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # input() runs in a worker thread so it never blocks the event loop
+            try:
+                command = (await loop.run_in_executor(None, input)).strip()
+            except EOFError:
+                return
+            if command.lower() == 'quit':
+                self.server.close()
+                return
+            self.handle_admin(command)
+
+    def handle_admin(self, command):
+        if command == '/list':
+            print(f"{len(self.clients)} clients, rooms: "
+                  + ", ".join(f"{r} ({len(m)})" for r, m in self.rooms.items()))
+        elif command.startswith('/say '):
+            message = f"Server says: {command[len('/say '):]}"
+            for client in list(self.clients.values()):
+                self.send(client, message)
+        elif command.startswith('/msg '):
+            _, client_id, message = (command.split(' ', 2) + [''])[:3]
+            client = self.clients.get(int(client_id)) if client_id.isdigit() else None
+            if client is None:
+                print(f"No client #{client_id}")
+            else:
+                self.send(client, f"Server says: {message}")
+        elif command.startswith('/kick '):
+            client_id = command[len('/kick '):].strip()
+            client = self.clients.get(int(client_id)) if client_id.isdigit() else None
+            if client is None:
+                print(f"No client #{client_id}")
+            else:
+                self.disconnect(client)
+        elif command:
+            print("Commands: /list, /say <msg>, /msg <id> <msg>, /kick <id>, quit")
+
+    async def serve(self, console=True):
+        self.server = await asyncio.start_server(
+            self.handle_client, self.host, self.port,
+            backlog=self.backlog, reuse_address=True,
+        )
+        print(f"=== Async Chat Server started on {self.host}:{self.port} (backlog {self.backlog}) ===")
+        print("Type /list, /say <msg>, /msg <id> <msg>, /kick <id> or 'quit'\n")
+
+        console_task = asyncio.create_task(self.admin_console()) if console else None
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for client in list(self.clients.values()):
+                self.disconnect(client)
+            if console_task is not None:
+                console_task.cancel()
+            print("Server socket closed")
+
+
+def start_async_server(host='localhost', port=12346, backlog=1024, queue_size=100):
+    try:
+        asyncio.run(AsyncChatServer(host, port, backlog, queue_size).serve())
+    except KeyboardInterrupt:
+        print("\nServer is shutting down...")
+
+
 if __name__ == "__main__":
-    start_server()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Chat server")
+    parser.add_argument('--mode', choices=['threaded', 'async'], default='threaded')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=12346)
+    parser.add_argument('--backlog', type=int, default=1024)
+    parser.add_argument('--queue-size', type=int, default=100,
+                        help="max pending messages per client before it is dropped")
+    args = parser.parse_args()
+
+    if args.mode == 'async':
+        start_async_server(args.host, args.port, args.backlog, args.queue_size)
+    else:
+        start_server(args.host, args.port, args.backlog)
@@ -0,0 +1,93 @@
+import asyncio
+import contextlib
+import io
+import socket
+import unittest
+from unittest import mock
+
+import protocol
+from protocol import (FLAG_ZLIB, HEADER, MAX_FRAME_SIZE, FrameReader, read_frame_async, send_frames,
+                      write_frames_async)
+from server import AsyncChatServer
+
+
+class TestAsyncChatServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.errors = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: self.errors.append(context))
+        self.chat = AsyncChatServer()
+        self.server = await asyncio.start_server(self.chat.handle_client, '127.0.0.1', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.output = contextlib.redirect_stdout(io.StringIO())
+        self.output.__enter__()
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.output.__exit__(None, None, None)
+
+    async def connect(self, room):
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        write_frames_async(writer, [f"/join {room}"])
+        self.assertEqual(await read_frame_async(reader), f"Joined room '{room}'")
+        return reader, writer
+
+    async def assert_dropped(self, raw_frame):
+        reader, writer = await self.connect('bad')
+        writer.write(raw_frame)
+        self.assertIsNone(await asyncio.wait_for(read_frame_async(reader), 5))
+        writer.close()
+        self.assertEqual(self.chat.clients, {})
+        self.assertEqual(self.chat.rooms, {})
+        self.assertEqual(self.errors, [])
+
+    async def test_oversized_frame_closes_connection(self):
+        await self.assert_dropped(HEADER.pack(MAX_FRAME_SIZE + 1, 0))
+
+    async def test_corrupt_compressed_frame_closes_connection(self):
+        await self.assert_dropped(HEADER.pack(4, FLAG_ZLIB) + b"junk")
+
+    async def test_invalid_utf8_is_replaced(self):
+        sender_reader, sender = await self.connect('room')
+        receiver_reader, receiver = await self.connect('room')
+        sender.write(HEADER.pack(3, 0) + b"a\xffb")
+        message = await asyncio.wait_for(read_frame_async(receiver_reader), 5)
+        self.assertTrue(message.endswith(": a�b"), message)
+        self.assertEqual(len(self.chat.clients), 2)
+        for writer in (sender, receiver):
+            writer.close()
+
+    async def test_oversized_outgoing_frame_disconnects_client(self):
+        reader, writer = await self.connect('room')
+        (client,) = self.chat.clients.values()
+        writer_task = client.writer_task
+        with mock.patch.object(protocol, 'MAX_FRAME_SIZE', 10):
+            self.chat.send(client, "longer than ten bytes")
+            self.assertIsNone(await asyncio.wait_for(read_frame_async(reader), 5))
+        await asyncio.wait([writer_task], timeout=5)
+        # The ProtocolError is handled, not left on the task
+        self.assertTrue(writer_task.cancelled() or writer_task.exception() is None)
+        writer.close()
+        self.assertEqual(self.chat.clients, {})
+        self.assertEqual(self.errors, [])
+
+
+class SendallOnlySocket:
+    """Socket without sendmsg(), like on Windows."""
+
+    def __init__(self, sock):
+        self.sendall = sock.sendall
+
+
+class TestSendFrames(unittest.TestCase):
+    def test_falls_back_to_sendall(self):
+        sender, receiver = socket.socketpair()
+        with sender, receiver:
+            messages = ["hello", "x" * 5000, "ünïcode"]
+            send_frames(SendallOnlySocket(sender), messages)
+            frames = FrameReader(receiver)
+            self.assertEqual([frames.read_frame() for _ in messages], messages)
+
+
+if __name__ == "__main__":
+    unittest.main()
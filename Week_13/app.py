@@ -1,11 +1,21 @@
 import jwt
+import json
+import time
+import bisect
+import hashlib
 import datetime
-from flask import Flask, request, jsonify, render_template
+import argparse
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from flask import Flask, Response, request, jsonify, render_template
 from werkzeug.security import generate_password_hash, check_password_hash
 from functools import wraps
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'professional_risk_management_2026'
+# Login attempts allowed per username per minute
+app.config['LOGIN_RATE_LIMIT'] = 10
 
 # --- PROFESSIONAL DATA STRUCTURE (Mock Database) ---
 # In a real scenario, these would be in a SQL/NoSQL DB
@@ -25,6 +35,217 @@ jobs = [
     {"id": 2, "title": "Risk Analyst", "company": "Secure Assets", "salary": "$140k", "desc": "Audit portfolio exposure."}
 ]
 
+# --- TOKEN CACHE ---
+class TokenCache:
+    """
+    Bounded LRU cache of verified JWT payloads, keyed by the SHA-256 of the
+    token so raw tokens are never kept in memory. An entry is only served
+    until the token's own 'exp', after which it is verified again.
+    """
+
+    def __init__(self, max_size=4096):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token):
+        return hashlib.sha256(token.encode('utf-8')).digest()
+
+    def get(self, token):
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            exp, data = entry
+            if exp <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def put(self, token, data):
+        # Tokens without an expiry are not cached: we could never honor it
+        if 'exp' not in data:
+            return
+        with self._lock:
+            self._entries[self._key(token)] = (data['exp'], data)
+            self._entries.move_to_end(self._key(token))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+token_cache = TokenCache()
+
+# --- JOB STORE ---
+class JobStore:
+    """
+    Jobs kept by id, with case-insensitive indexes on company and title.
+    Serialized JSON bodies (and their ETags) are cached per query and only
+    dropped when a job is added, updated or removed.
+    """
+    INDEXED_FIELDS = ('company', 'title')
+
+    def __init__(self, jobs, max_cached_bodies=256):
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._ids = []
+        self._index = {field: {} for field in self.INDEXED_FIELDS}
+        self._bodies = OrderedDict()
+        self.max_cached_bodies = max_cached_bodies
+        self.version = 0
+        for job in jobs:
+            self.add(job)
+
+    def _index_job(self, job):
+        for field in self.INDEXED_FIELDS:
+            self._index[field].setdefault(str(job[field]).lower(), set()).add(job['id'])
+
+    def _unindex_job(self, job):
+        for field in self.INDEXED_FIELDS:
+            key = str(job[field]).lower()
+            ids = self._index[field][key]
+            ids.discard(job['id'])
+            if not ids:
+                del self._index[field][key]
+
+    def _changed(self):
+        self.version += 1
+        self._bodies.clear()
+
+    def add(self, job):
+        with self._lock:
+            if job['id'] in self._jobs:
+                raise ValueError(f"Job {job['id']} already exists")
+            self._jobs[job['id']] = dict(job)
+            bisect.insort(self._ids, job['id'])
+            self._index_job(job)
+            self._changed()
+
+    def update(self, job_id, **changes):
+        # The id keys the store and the sorted id list; it cannot change
+        if 'id' in changes:
+            raise ValueError("Job id cannot be updated")
+        with self._lock:
+            job = self._jobs[job_id]
+            self._unindex_job(job)
+            job.update(changes)
+            self._index_job(job)
+            self._changed()
+
+    def remove(self, job_id):
+        with self._lock:
+            job = self._jobs.pop(job_id)
+            self._ids.remove(job_id)
+            self._unindex_job(job)
+            self._changed()
+
+    def all(self):
+        with self._lock:
+            return [dict(self._jobs[job_id]) for job_id in self._ids]
+
+    def _query(self, filters, cursor, limit):
+        # Returns (matching jobs for this page, next cursor or None)
+        if filters:
+            matches = [self._index[field].get(value.lower(), set()) for field, value in filters.items()]
+            ids = sorted(set.intersection(*matches))
+        else:
+            ids = self._ids
+
+        start = bisect.bisect_right(ids, cursor) if cursor is not None else 0
+        end = len(ids) if limit is None else min(start + limit, len(ids))
+        next_cursor = ids[end - 1] if end < len(ids) and end > start else None
+        return [self._jobs[job_id] for job_id in ids[start:end]], next_cursor
+
+    def render(self, filters=None, cursor=None, limit=None, fields=None):
+        """Returns (json_body, etag, next_cursor), cached until jobs change."""
+        filters = {k: v for k, v in (filters or {}).items() if v}
+        key = (tuple(sorted(filters.items())), cursor, limit, tuple(fields) if fields else None)
+
+        with self._lock:
+            cached = self._bodies.get(key)
+            if cached is not None:
+                self._bodies.move_to_end(key)
+                return cached
+
+            page, next_cursor = self._query(filters, cursor, limit)
+            if fields:
+                page = [{f: job[f] for f in fields if f in job} for job in page]
+            # Same key order as jsonify, which sorts keys
+            body = json.dumps(page, separators=(',', ':'), sort_keys=True)
+            etag = f"v{self.version}-{hashlib.sha1(body.encode('utf-8')).hexdigest()[:16]}"
+
+            self._bodies[key] = (body, etag, next_cursor)
+            while len(self._bodies) > self.max_cached_bodies:
+                self._bodies.popitem(last=False)
+            return body, etag, next_cursor
+
+job_store = JobStore(jobs)
+
+# --- LOGIN THROTTLING ---
+# Unknown users are checked against this hash (computed once) so a failed
+# login costs the same PBKDF2 work whether or not the user exists
+DUMMY_PASSWORD_HASH = generate_password_hash("timing-safe-placeholder")
+
+class LoginRateLimiter:
+    """Token bucket per username; buckets are kept in a bounded LRU."""
+
+    def __init__(self, per_minute, max_users=10000):
+        self.capacity = per_minute
+        self.refill_per_second = per_minute / 60.0
+        self.max_users = max_users
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def allow(self, username):
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.pop(username, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last) * self.refill_per_second)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[username] = (tokens, now)
+            while len(self._buckets) > self.max_users:
+                self._buckets.popitem(last=False)
+            return allowed
+
+    def retry_after(self):
+        return max(1, int(1 / self.refill_per_second))
+
+class PasswordPoolBusy(Exception):
+    pass
+
+class PasswordVerifier:
+    """
+    Runs check_password_hash in a bounded worker pool. At most max_workers
+    hashes are computed at once and at most max_pending may wait; beyond that
+    logins are rejected instead of piling up and starving other endpoints.
+    A hash that is not done within the timeout is rejected the same way.
+    """
+
+    def __init__(self, max_workers=2, max_pending=32):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='password-hash')
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def verify(self, password_hash, password, timeout=30):
+        if not self._slots.acquire(blocking=False):
+            raise PasswordPoolBusy()
+        future = self._pool.submit(check_password_hash, password_hash, password)
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise PasswordPoolBusy()
+
+login_limiter = LoginRateLimiter(app.config['LOGIN_RATE_LIMIT'])
+password_verifier = PasswordVerifier()
+
 # --- AUTH MIDDLEWARE ---
 def token_required(f):
     @wraps(f)
@@ -33,9 +254,13 @@ def token_required(f):
         if not token:
             return jsonify({'message': 'Unauthenticated access!'}), 401
         try:
-            # Note: We use 'jwt' here (from PyJWT)
-            data = jwt.decode(token.split(" ")[1], app.config['SECRET_KEY'], algorithms=["HS256"])
-            current_user = data
+            raw_token = token.split(" ")[1]
+            current_user = token_cache.get(raw_token)
+            if current_user is None:
+                # Note: We use 'jwt' here (from PyJWT)
+                data = jwt.decode(raw_token, app.config['SECRET_KEY'], algorithms=["HS256"])
+                token_cache.put(raw_token, data)
+                current_user = data
         except:
             return jsonify({'message': 'Token is invalid or expired!'}), 401
         return f(current_user, *args, **kwargs)
@@ -52,8 +277,20 @@ def login():
     username = data.get('username')
     password = data.get('password')
 
+    if not login_limiter.allow(str(username)):
+        response = jsonify({'message': 'Too many login attempts, try again later'})
+        response.headers['Retry-After'] = str(login_limiter.retry_after())
+        return response, 429
+
     user = users.get(username)
-    if not user or not check_password_hash(user['password'], password):
+    password_hash = user['password'] if user else DUMMY_PASSWORD_HASH
+    try:
+        valid = password_verifier.verify(password_hash, password or '')
+    except PasswordPoolBusy:
+        response = jsonify({'message': 'Server busy, try again later'})
+        response.headers['Retry-After'] = '1'
+        return response, 503
+    if not user or not valid:
         return jsonify({'message': 'Invalid credentials'}), 401
 
     token = jwt.encode({
@@ -67,7 +304,51 @@ def login():
 @app.route('/api/vacancies', methods=['GET'])
 @token_required
 def get_vacancies(current_user):
-    return jsonify(jobs)
+    # Optional: ?company=&title= filters, ?fields=id,title projection,
+    # ?limit=&cursor= pagination (next cursor in the X-Next-Cursor header)
+    try:
+        limit = request.args.get('limit')
+        limit = int(limit) if limit is not None else None
+        cursor = request.args.get('cursor')
+        cursor = int(cursor) if cursor is not None else None
+        if limit is not None and limit <= 0:
+            raise ValueError
+    except ValueError:
+        return jsonify({'message': 'Invalid pagination parameters'}), 400
+
+    fields = [f for f in request.args.get('fields', '').split(',') if f] or None
+    filters = {field: request.args.get(field) for field in JobStore.INDEXED_FIELDS}
+    body, etag, next_cursor = job_store.render(filters, cursor, limit, fields)
+
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    # Private: the body depends on the Authorization header
+    response.headers['Cache-Control'] = 'private, no-cache'
+    if next_cursor is not None:
+        response.headers['X-Next-Cursor'] = str(next_cursor)
+    return response.make_conditional(request)
+
+def configure_login(workers, max_pending, rate_limit):
+    global login_limiter, password_verifier
+    app.config['LOGIN_RATE_LIMIT'] = rate_limit
+    login_limiter = LoginRateLimiter(rate_limit)
+    password_verifier = PasswordVerifier(workers, max_pending)
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Job portal API")
+    parser.add_argument('--threaded', action='store_true',
+                        help="serve with the threaded WSGI server (no debug reloader)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--hash-workers', type=int, default=2,
+                        help="threads computing password hashes")
+    parser.add_argument('--max-pending-logins', type=int, default=32)
+    parser.add_argument('--login-rate-limit', type=int, default=app.config['LOGIN_RATE_LIMIT'],
+                        help="login attempts per username per minute")
+    args = parser.parse_args()
+
+    configure_login(args.hash_workers, args.max_pending_logins, args.login_rate_limit)
+    if args.threaded:
+        app.run(host=args.host, port=args.port, debug=False, threaded=True)
+    else:
+        app.run(host=args.host, port=args.port, debug=True)
\ No newline at end of file
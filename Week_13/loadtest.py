@@ -0,0 +1,113 @@
+import json
+import math
+import time
+import argparse
+import threading
+import urllib.error
+import urllib.request
+from collections import Counter
+
+# --- Stdlib-only load generator for app.py ---
+# Start the API first, e.g.:  python app.py --threaded --login-rate-limit 100000
+# then:                       python loadtest.py --workers 16 --duration 20
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Recorder:
+    """Thread-safe latency and status collector per endpoint."""
+
+    def __init__(self):
+        self.latencies = {}
+        self.statuses = Counter()
+        self.lock = threading.Lock()
+
+    def record(self, endpoint, seconds, status):
+        with self.lock:
+            self.latencies.setdefault(endpoint, []).append(seconds * 1000)
+            self.statuses[(endpoint, status)] += 1
+
+    def report(self, elapsed):
+        print(f"--- {sum(self.statuses.values())} requests in {elapsed:.1f}s ---")
+        for endpoint, values in sorted(self.latencies.items()):
+            values.sort()
+            # Status codes are ints, failed connections are recorded as 'error'
+            codes = ", ".join(f"{code}: {n}" for (name, code), n in sorted(self.statuses.items(), key=lambda kv: str(kv[0][1]))
+                              if name == endpoint)
+            print(f"{endpoint:<12} n={len(values):<6} {len(values) / elapsed:8.1f} req/s  "
+                  f"p50={percentile(values, 50):7.1f}ms  p95={percentile(values, 95):7.1f}ms  "
+                  f"p99={percentile(values, 99):7.1f}ms  ({codes})")
+
+
+def request(url, data=None, headers=None):
+    body = json.dumps(data).encode('utf-8') if data is not None else None
+    req = urllib.request.Request(url, data=body, headers=headers or {})
+    if body is not None:
+        req.add_header('Content-Type', 'application/json')
+
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=30) as res:
+            payload = res.read()
+            status = res.status
+    except urllib.error.HTTPError as e:
+        payload = e.read()
+        status = e.code
+    except (urllib.error.URLError, OSError):
+        payload = b''
+        status = 'error'
+    return time.perf_counter() - start, status, payload
+
+
+def worker(base_url, username, password, deadline, login_every, recorder):
+    token = None
+    count = 0
+
+    while time.perf_counter() < deadline:
+        # Log in first, then again every `login_every` requests
+        if token is None or count % login_every == 0:
+            seconds, status, payload = request(f"{base_url}/api/login",
+                                               {'username': username, 'password': password})
+            recorder.record('login', seconds, status)
+            if status == 200:
+                token = json.loads(payload)['token']
+            elif token is None:
+                time.sleep(0.05)
+                count += 1
+                continue
+
+        headers = {'Authorization': f'Bearer {token}'}
+        seconds, status, _ = request(f"{base_url}/api/vacancies", headers=headers)
+        recorder.record('vacancies', seconds, status)
+        count += 1
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure login and vacancy latency against app.py")
+    parser.add_argument('--base-url', default='http://127.0.0.1:5000')
+    parser.add_argument('--workers', type=int, default=8, help="concurrent clients")
+    parser.add_argument('--duration', type=float, default=10.0, help="seconds to run")
+    parser.add_argument('--login-every', type=int, default=10,
+                        help="each client logs in again after this many vacancy requests")
+    parser.add_argument('--username', default='member_user')
+    parser.add_argument('--password', default='member123')
+    args = parser.parse_args()
+
+    recorder = Recorder()
+    deadline = time.perf_counter() + args.duration
+    threads = [
+        threading.Thread(target=worker, args=(args.base_url, args.username, args.password,
+                                              deadline, args.login_every, recorder))
+        for _ in range(args.workers)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    recorder.report(time.perf_counter() - start)
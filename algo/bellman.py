@@ -1,3 +1,23 @@
+import os
+import sys
+from collections import deque
+from heapq import heappop, heappush
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+# floyd.py ada di direktori yang sama; tambahkan ke sys.path agar import ini
+# juga berhasil saat modul dijalankan atau diimpor dari luar algo/
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from floyd import floyd_warshall_numpy  # noqa: E402
+
+INF = float('inf')
+NO_PREDECESSOR = -1
+
+# Graf dengan E >= rasio ini * V^2 dianggap dense dan memakai Floyd-Warshall
+DENSE_GRAPH_RATIO = 0.25
+
+
 def bellman_ford(vertices, edges, source):
     # Inisialisasi jarak
     distance = {v: float('inf') for v in vertices}
@@ -18,29 +38,352 @@ def bellman_ford(vertices, edges, source):
     return distance
 
 
-# Daftar vertex
-vertices = [1, 2, 3, 4, 5, 6, 7]
-
-# Daftar edge (u, v, weight)
-edges = [
-    (1, 2, 6),
-    (1, 3, 5),
-    (1, 4, 5),
-    (3, 2, -2),
-    (4, 3, -2),
-    (2, 5, -1),
-    (3, 5, 1),
-    (4, 6, -1),
-    (5, 7, 3),
-    (6, 7, 3)
-]
-
-# Jalankan Bellman-Ford
-source = 1
-result = bellman_ford(vertices, edges, source)
-
-# Tampilkan hasil
-if result:
-    print("Jarak terpendek dari simpul", source)
-    for v in result:
-        print(f"Ke simpul {v} = {result[v]}")
\ No newline at end of file
+class NegativeCycleError(Exception):
+    # Dilempar bila ada negative weight cycle yang terjangkau dari source
+    def __init__(self, cycle):
+        super().__init__("Negative weight cycle terdeteksi: " + " -> ".join(map(str, cycle)))
+        self.cycle = cycle
+
+
+class CSRGraph:
+    """
+    Edge disimpan dalam array kompak (CSR) yang diurutkan berdasarkan source:
+    edge milik verteks i ada di targets/weights[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(self, vertices, edges):
+        self.vertices = list(vertices)
+        self.index = {v: i for i, v in enumerate(self.vertices)}
+        n = len(self.vertices)
+
+        edge_array = np.array(
+            [(self.index[u], self.index[v], w) for u, v, w in edges],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        sources = edge_array[:, 0].astype(np.int64)
+        order = np.argsort(sources, kind='stable')
+
+        self.sources = sources[order]
+        self.targets = edge_array[order, 1].astype(np.int64)
+        self.weights = edge_array[order, 2]
+        self.offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.sources, minlength=n), out=self.offsets[1:])
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def out_edges(self, active):
+        # Indeks semua edge yang keluar dari verteks-verteks di active
+        starts = self.offsets[active]
+        counts = self.offsets[active + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+        shift = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        return shift + np.arange(total)
+
+
+def find_predecessor_cycle(predecessor, start):
+    # Cari cycle pada graf predecessor, mulai dari start lalu dari semua verteks
+    n = len(predecessor)
+    state = [0] * n  # 0 = belum, 1 = sedang ditelusuri, 2 = selesai
+
+    for origin in [start] + list(range(n)):
+        chain = []
+        v = origin
+        while v != NO_PREDECESSOR and state[v] == 0:
+            state[v] = 1
+            chain.append(v)
+            v = predecessor[v]
+        if v != NO_PREDECESSOR and state[v] == 1:
+            cycle = chain[chain.index(v):]
+            cycle.reverse()
+            return cycle + [cycle[0]]
+        for u in chain:
+            state[u] = 2
+    return None
+
+
+def spfa_csr(graph, source):
+    """
+    Bellman-Ford berbasis queue (SPFA): hanya edge dari verteks yang jaraknya
+    berubah yang direlaksasi ulang. Mengembalikan (distance, predecessor)
+    sebagai list berindeks verteks.
+    """
+    n = len(graph)
+    offsets = graph.offsets.tolist()
+    targets = graph.targets.tolist()
+    weights = graph.weights.tolist()
+
+    distance = [INF] * n
+    predecessor = [NO_PREDECESSOR] * n
+    # Jumlah edge pada jalur yang menghasilkan distance[v]
+    length = [0] * n
+    in_queue = [False] * n
+
+    distance[source] = 0
+    queue = deque([source])
+    in_queue[source] = True
+
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+        du = distance[u]
+
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            candidate = du + weights[e]
+            if candidate < distance[v]:
+                distance[v] = candidate
+                predecessor[v] = u
+                length[v] = length[u] + 1
+
+                # Jalur dengan >= V edge pasti melewati negative cycle
+                if length[v] >= n:
+                    cycle = find_predecessor_cycle(predecessor, v)
+                    if cycle is not None:
+                        raise NegativeCycleError([graph.vertices[i] for i in cycle])
+
+                if not in_queue[v]:
+                    in_queue[v] = True
+                    queue.append(v)
+
+    return distance, predecessor
+
+
+def relax_passes(graph, distance, predecessor, active):
+    """
+    Pass Bellman-Ford dengan NumPy: setiap pass hanya merelaksasi edge dari
+    verteks di active (yang berubah di pass sebelumnya) dan berhenti begitu
+    tidak ada perubahan. distance dan predecessor diperbarui in-place.
+    """
+    n = len(graph)
+    passes = 0
+
+    while len(active):
+        # Masih berubah setelah V pass: ada negative cycle
+        if passes >= n:
+            cycle = find_predecessor_cycle(predecessor.tolist(), int(active[0]))
+            if cycle is not None:
+                raise NegativeCycleError([graph.vertices[i] for i in cycle])
+
+        edge_ids = graph.out_edges(active)
+        tails = graph.sources[edge_ids]
+        heads = graph.targets[edge_ids]
+        candidate = distance[tails] + graph.weights[edge_ids]
+
+        updated = distance.copy()
+        np.minimum.at(updated, heads, candidate)
+        changed = updated < distance
+
+        # Simpan satu edge yang mencapai jarak minimum untuk setiap verteks
+        winners = changed[heads] & (candidate == updated[heads])
+        predecessor[heads[winners]] = tails[winners]
+        distance[:] = updated
+        active = np.flatnonzero(changed)
+        passes += 1
+
+    return distance, predecessor
+
+
+def bellman_ford_passes_csr(graph, source):
+    # Mengembalikan (distance, predecessor) sebagai ndarray
+    n = len(graph)
+    distance = np.full(n, INF)
+    predecessor = np.full(n, NO_PREDECESSOR, dtype=np.int64)
+    distance[source] = 0
+
+    return relax_passes(graph, distance, predecessor, np.array([source], dtype=np.int64))
+
+
+def bellman_ford_fast(vertices, edges, source, method='spfa'):
+    """
+    Versi cepat dari bellman_ford dengan hasil yang sama ({verteks: jarak}).
+    method='spfa' memakai queue, method='passes' memakai pass NumPy dengan
+    early exit. Negative cycle dilaporkan lewat NegativeCycleError.
+    """
+    graph = edges if isinstance(edges, CSRGraph) else CSRGraph(vertices, edges)
+    start = graph.index[source]
+
+    if method == 'spfa':
+        distance, _ = spfa_csr(graph, start)
+    elif method == 'passes':
+        distance, _ = bellman_ford_passes_csr(graph, start)
+    else:
+        raise ValueError(f"Unknown method: {method}")
+
+    return {v: float(distance[i]) for i, v in enumerate(graph.vertices)}
+
+
+def johnson_potentials(graph):
+    # Jarak dari verteks virtual yang punya edge 0 ke semua verteks
+    n = len(graph)
+    distance = np.zeros(n)
+    predecessor = np.full(n, NO_PREDECESSOR, dtype=np.int64)
+    relax_passes(graph, distance, predecessor, np.arange(n))
+    return distance
+
+
+def dijkstra_row(offsets, targets, weights, n, source):
+    distance = [INF] * n
+    distance[source] = 0.0
+    heap = [(0.0, source)]
+
+    while heap:
+        du, u = heappop(heap)
+        if du > distance[u]:
+            continue
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            candidate = du + weights[e]
+            if candidate < distance[v]:
+                distance[v] = candidate
+                heappush(heap, (candidate, v))
+
+    return distance
+
+
+# State worker pool: view ke shared memory yang dibuat oleh proses utama
+worker_state = {}
+
+
+def share_array(array):
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 8))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    return shm
+
+
+def attach_worker(offsets_name, targets_name, weights_name, result_name, shape):
+    handles = [
+        shared_memory.SharedMemory(name=name)
+        for name in (offsets_name, targets_name, weights_name, result_name)
+    ]
+    worker_state['handles'] = handles
+    worker_state['offsets'] = handles[0].buf.cast('q')
+    worker_state['targets'] = handles[1].buf.cast('q')
+    worker_state['weights'] = handles[2].buf.cast('d')
+    worker_state['result'] = np.ndarray(shape, dtype=np.float64, buffer=handles[3].buf)
+
+
+def dijkstra_task(tasks):
+    # tasks berisi (baris hasil, indeks source); hasil ditulis ke shared memory
+    state = worker_state
+    n = state['result'].shape[1]
+    for row, source in tasks:
+        state['result'][row] = dijkstra_row(state['offsets'], state['targets'], state['weights'], n, source)
+    return len(tasks)
+
+
+def dijkstra_many(graph, weights, sources, processes=None):
+    n = len(graph)
+    tasks = list(enumerate(sources.tolist()))
+
+    if processes == 1 or len(tasks) < 2:
+        offsets, targets, weight_list = graph.offsets.tolist(), graph.targets.tolist(), weights.tolist()
+        return np.array([dijkstra_row(offsets, targets, weight_list, n, s) for _, s in tasks]).reshape(len(tasks), n)
+
+    # Edge dibagikan sekali lewat shared memory, bukan di-pickle per task
+    workers = processes or os.cpu_count() or 1
+    result = np.empty((len(tasks), n))
+    handles = [share_array(graph.offsets), share_array(graph.targets), share_array(weights), share_array(result)]
+    try:
+        with Pool(workers, attach_worker, [h.name for h in handles] + [result.shape]) as pool:
+            chunk = max(1, len(tasks) // (workers * 4))
+            chunks = [tasks[i:i + chunk] for i in range(0, len(tasks), chunk)]
+            for _ in pool.imap_unordered(dijkstra_task, chunks):
+                pass
+        result[:] = np.ndarray(result.shape, dtype=np.float64, buffer=handles[3].buf)
+    finally:
+        for handle in handles:
+            handle.close()
+            handle.unlink()
+
+    return result
+
+
+def floyd_rows(graph, sources):
+    n = len(graph)
+    matrix = np.full((n, n), INF)
+    np.fill_diagonal(matrix, 0)
+    np.minimum.at(matrix, (graph.sources, graph.targets), graph.weights)
+
+    dist = floyd_warshall_numpy(matrix)
+    if (np.diagonal(dist) < 0).any():
+        # Biarkan relax_passes menemukan dan melaporkan cycle-nya
+        johnson_potentials(graph)
+    return dist[sources]
+
+
+def shortest_paths_from_sources(vertices, edges, sources, method='auto', processes=None):
+    """
+    Jarak terpendek dari banyak source sekaligus. Mengembalikan ndarray
+    berukuran (len(sources), len(vertices)); kolom mengikuti urutan vertices.
+
+    method='auto' memilih Floyd-Warshall untuk graf dense dan Johnson
+    (Bellman-Ford untuk reweighting + Dijkstra per source di process pool)
+    untuk graf sparse. method='dijkstra' melewati reweighting dan hanya untuk
+    bobot non-negatif.
+    """
+    graph = edges if isinstance(edges, CSRGraph) else CSRGraph(vertices, edges)
+    rows = np.array([graph.index[s] for s in sources], dtype=np.int64)
+    n = len(graph)
+
+    if method == 'auto':
+        method = 'floyd' if len(graph.targets) >= DENSE_GRAPH_RATIO * n * n else 'johnson'
+
+    if method == 'floyd':
+        return floyd_rows(graph, rows)
+
+    if method == 'johnson':
+        potential = johnson_potentials(graph)
+        weights = graph.weights + potential[graph.sources] - potential[graph.targets]
+        # Bobot hasil reweighting >= 0; buang sisa galat floating point
+        np.maximum(weights, 0, out=weights)
+    elif method == 'dijkstra':
+        if (graph.weights < 0).any():
+            raise ValueError("method='dijkstra' requires non-negative weights")
+        potential = None
+        weights = graph.weights
+    else:
+        raise ValueError(f"Unknown method: {method}")
+
+    result = dijkstra_many(graph, weights, rows, processes)
+    if potential is not None:
+        result += potential[None, :] - potential[rows][:, None]
+    return result
+
+
+if __name__ == "__main__":
+    # Daftar vertex
+    vertices = [1, 2, 3, 4, 5, 6, 7]
+
+    # Daftar edge (u, v, weight)
+    edges = [
+        (1, 2, 6),
+        (1, 3, 5),
+        (1, 4, 5),
+        (3, 2, -2),
+        (4, 3, -2),
+        (2, 5, -1),
+        (3, 5, 1),
+        (4, 6, -1),
+        (5, 7, 3),
+        (6, 7, 3)
+    ]
+
+    # Jalankan Bellman-Ford
+    source = 1
+    result = bellman_ford(vertices, edges, source)
+
+    # Tampilkan hasil
+    if result:
+        print("Jarak terpendek dari simpul", source)
+        for v in result:
+            print(f"Ke simpul {v} = {result[v]}")
+
+    # Versi cepat (CSR + SPFA)
+    print("\nJarak terpendek (SPFA):", bellman_ford_fast(vertices, edges, source))
+
+    # Banyak source sekaligus
+    print("Jarak dari simpul 1 dan 4:")
+    print(shortest_paths_from_sources(vertices, edges, [1, 4], processes=2))
@@ -29,19 +29,214 @@ def floyd_warshall(graph):
 
     return dist
 
-INF = float('inf')
-
-# Matriks Jarak Awal (A0): 4 Verteks
-graph_initial = [
-    [0, 3, INF, 7],     # Dari 1 (0)
-    [8, 0, 2, INF],     # Dari 2 (1)
-    [5, INF, 0, 1],     # Dari 3 (2)
-    [2, INF, INF, 0]    # Darilara 4 (3)
-]
-
-# Jalankan Algoritma
-shortest_paths = floyd_warshall(graph_initial)
-
-# Tampilkan Hasil dalam format matriks
-print("Matriks Jarak Terpendek Akhir (Floyd-Warshall):")
-print(np.array(shortest_paths))
\ No newline at end of file
+
+NO_PREDECESSOR = -1
+
+
+def init_predecessor(dist):
+    # pred[i][j] = verteks sebelum j pada jalur terpendek i -> j
+    n = dist.shape[0]
+    pred = np.full((n, n), NO_PREDECESSOR, dtype=np.int64)
+    rows = np.arange(n)[:, None]
+    reachable = np.isfinite(dist) & (rows != np.arange(n)[None, :])
+    pred[reachable] = np.broadcast_to(rows, (n, n))[reachable]
+    return pred
+
+
+def floyd_warshall_numpy(graph, return_predecessor=False):
+    """
+    Floyd-Warshall dengan NumPy: setiap langkah k adalah satu
+    broadcast np.minimum pada matriks float64.
+    """
+    dist = np.array(graph, dtype=np.float64)
+    n = dist.shape[0]
+    pred = init_predecessor(dist) if return_predecessor else None
+
+    # Buffer kandidat dipakai ulang agar tidak alokasi n x n tiap langkah
+    candidate = np.empty_like(dist)
+
+    for k in range(n):
+        # Kandidat jalur i -> k -> j untuk semua (i, j) sekaligus
+        np.add(dist[:, k, None], dist[None, k, :], out=candidate)
+
+        if pred is None:
+            np.minimum(dist, candidate, out=dist)
+        else:
+            better = candidate < dist
+            np.copyto(dist, candidate, where=better)
+            np.copyto(pred, np.broadcast_to(pred[k], pred.shape), where=better)
+
+    if return_predecessor:
+        return dist, pred
+    return dist
+
+
+def relax_block(dist, rows, cols, ks):
+    # Perbarui blok dist[rows, cols] memakai perantara k di dalam ks
+    block = dist[rows, cols]
+    for k in range(ks.start, ks.stop):
+        np.minimum(block, dist[rows, k, None] + dist[k, None, cols], out=block)
+
+
+def is_tight(candidate, target):
+    # candidate == target, dengan toleransi kecil untuk pembulatan float
+    # (inf - inf menghasilkan nan, yang memang tidak dianggap ketat)
+    with np.errstate(invalid='ignore'):
+        return np.abs(candidate - target) <= 1e-9 * np.maximum(1.0, np.abs(target))
+
+
+def predecessors_from_distances(dist, weights, pred, block_size=256):
+    """
+    Isi pred dari jarak yang sudah final. Edge u -> j "ketat" untuk source i
+    bila dist[i][u] + w(u, j) == dist[i][j]. Per source dilakukan BFS pada
+    edge ketat, sehingga pred[i][j] adalah verteks sebelum j pada jalur
+    terpendek dengan edge paling sedikit. Karena berupa pohon BFS, pred tidak
+    pernah membentuk siklus, juga pada siklus berbobot nol. Baris weights
+    dibaca per potongan block_size agar memori tetap terbatas.
+    """
+    n = dist.shape[0]
+    for i in range(n):
+        target = np.array(dist[i])
+        row = np.full(n, NO_PREDECESSOR, dtype=np.int64)
+        visited = np.zeros(n, dtype=bool)
+        visited[i] = True
+        frontier = np.array([i])
+
+        while len(frontier):
+            reached = []
+            for start in range(0, len(frontier), block_size):
+                sources = frontier[start:start + block_size]
+                candidate = target[sources, None] + weights[sources]
+                tight = np.isfinite(candidate) & is_tight(candidate, target[None, :])
+                tight &= ~visited[None, :]
+                found = tight.any(axis=0)
+                row[found] = sources[tight.argmax(axis=0)[found]]
+                visited |= found
+                reached.append(np.flatnonzero(found))
+            frontier = np.concatenate(reached)
+
+        pred[i] = row
+
+
+def floyd_warshall_blocked_inplace(dist, pred=None, block_size=256, weights=None):
+    """
+    Floyd-Warshall ter-blok (tiled) yang bekerja langsung pada dist
+    (ndarray atau np.memmap). Setiap blok cukup kecil untuk muat di cache.
+
+    Urutan blok membuat predecessor yang diperbarui selama iterasi bisa
+    membentuk siklus bila ada edge negatif, jadi pred dihitung ulang dari
+    jarak akhir dengan predecessors_from_distances. Untuk itu dibutuhkan
+    bobot edge asli (weights); bila tidak diberikan, dist disalin dulu.
+    """
+    if pred is not None and weights is None:
+        weights = np.array(dist)
+
+    n = dist.shape[0]
+    blocks = [slice(start, min(start + block_size, n)) for start in range(0, n, block_size)]
+
+    for kb, ks in enumerate(blocks):
+        # Fase 1: blok diagonal
+        relax_block(dist, ks, ks, ks)
+
+        # Fase 2: blok pada baris dan kolom yang sama dengan blok diagonal
+        for b, other in enumerate(blocks):
+            if b != kb:
+                relax_block(dist, ks, other, ks)
+                relax_block(dist, other, ks, ks)
+
+        # Fase 3: sisa blok
+        for ib, rows in enumerate(blocks):
+            if ib == kb:
+                continue
+            for jb, cols in enumerate(blocks):
+                if jb != kb:
+                    relax_block(dist, rows, cols, ks)
+
+    if pred is not None:
+        predecessors_from_distances(dist, weights, pred, block_size)
+    return dist
+
+
+def floyd_warshall_blocked(graph, block_size=256, return_predecessor=False):
+    dist = np.array(graph, dtype=np.float64)
+    pred = init_predecessor(dist) if return_predecessor else None
+
+    floyd_warshall_blocked_inplace(dist, pred, block_size)
+
+    if return_predecessor:
+        return dist, pred
+    return dist
+
+
+def floyd_warshall_memmap(input_path, output_path, n, block_size=256, predecessor_path=None):
+    """
+    Floyd-Warshall untuk matriks yang lebih besar dari RAM.
+    input_path berisi n*n float64 (row-major). Hasil ditulis ke output_path,
+    dan matriks predecessor (int64) ke predecessor_path bila diberikan.
+    """
+    source = np.memmap(input_path, dtype=np.float64, mode='r', shape=(n, n))
+    dist = np.memmap(output_path, dtype=np.float64, mode='w+', shape=(n, n))
+
+    # Salin input per potongan baris agar memori tetap terbatas
+    pred = None
+    if predecessor_path is not None:
+        pred = np.memmap(predecessor_path, dtype=np.int64, mode='w+', shape=(n, n))
+
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        dist[start:stop] = source[start:stop]
+
+    # source tetap dibuka: bobot asli dibutuhkan untuk menghitung pred
+    floyd_warshall_blocked_inplace(dist, pred, block_size, weights=source)
+    del source
+
+    dist.flush()
+    if pred is not None:
+        pred.flush()
+        return dist, pred
+    return dist
+
+
+def reconstruct_path(pred, i, j):
+    # Susun jalur i -> j dari matriks predecessor
+    if i != j and pred[i][j] == NO_PREDECESSOR:
+        return []
+
+    # Jalur sederhana punya paling banyak n verteks; lebih dari itu berarti
+    # pred berisi siklus
+    n = len(pred)
+    path = [j]
+    while j != i:
+        if len(path) > n:
+            raise ValueError(f"Matriks predecessor berisi siklus pada jalur {i} -> {path[0]}")
+        j = int(pred[i][j])
+        if j == NO_PREDECESSOR:
+            raise ValueError(f"Jalur {i} -> {path[0]} terputus di verteks {path[-1]}")
+        path.append(j)
+    path.reverse()
+    return path
+
+
+if __name__ == "__main__":
+    INF = float('inf')
+
+    # Matriks Jarak Awal (A0): 4 Verteks
+    graph_initial = [
+        [0, 3, INF, 7],     # Dari 1 (0)
+        [8, 0, 2, INF],     # Dari 2 (1)
+        [5, INF, 0, 1],     # Dari 3 (2)
+        [2, INF, INF, 0]    # Darilara 4 (3)
+    ]
+
+    # Jalankan Algoritma
+    shortest_paths = floyd_warshall(graph_initial)
+
+    # Tampilkan Hasil dalam format matriks
+    print("Matriks Jarak Terpendek Akhir (Floyd-Warshall):")
+    print(np.array(shortest_paths))
+
+    # Versi NumPy dengan predecessor untuk rekonstruksi jalur
+    dist_np, pred_np = floyd_warshall_numpy(graph_initial, return_predecessor=True)
+    print("\nMatriks Jarak Terpendek (NumPy):")
+    print(dist_np)
+    print("Jalur terpendek 2 -> 4:", [v + 1 for v in reconstruct_path(pred_np, 1, 3)])
@@ -0,0 +1,83 @@
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from floyd import (NO_PREDECESSOR, floyd_warshall_blocked, floyd_warshall_memmap,
+                   floyd_warshall_numpy, reconstruct_path)
+
+INF = float('inf')
+
+
+def random_graph(rng, n, density=0.4, low=-3, high=10):
+    # Bobot negatif tanpa siklus negatif: potensial h membuat w(u, v) + h[u] - h[v] >= 0
+    h = [rng.randint(0, 6) for _ in range(n)]
+    graph = [[0 if i == j else INF for j in range(n)] for i in range(n)]
+    for i in range(n):
+        for j in range(n):
+            if i != j and rng.random() < density:
+                graph[i][j] = rng.randint(0, high + low) + h[j] - h[i]
+    return graph
+
+
+class TestBlockedPredecessors(unittest.TestCase):
+    def assert_paths_match(self, graph, dist, pred):
+        expected = floyd_warshall_numpy(graph)
+        np.testing.assert_array_equal(dist, expected)
+        n = len(graph)
+        for i in range(n):
+            for j in range(n):
+                path = reconstruct_path(pred, i, j)
+                if not np.isfinite(expected[i][j]):
+                    self.assertEqual(path, [])
+                    continue
+                self.assertEqual((path[0], path[-1]), (i, j))
+                self.assertEqual(len(set(path)), len(path))
+                cost = sum(graph[u][v] for u, v in zip(path, path[1:]))
+                self.assertEqual(cost, expected[i][j])
+
+    def test_negative_edges(self):
+        graph = [[0, INF, 3, 1], [INF, 0, -3, 4], [2, 3, 0, INF], [INF, 1, 4, 0]]
+        dist, pred = floyd_warshall_blocked(graph, 2, True)
+        self.assertEqual(reconstruct_path(pred, 0, 1), [0, 3, 1])
+        self.assert_paths_match(graph, dist, pred)
+
+    def test_zero_weight_cycles(self):
+        graph = [[0, 1, INF, INF, INF],
+                 [INF, 0, 0, INF, INF],
+                 [INF, 0, 0, 0, INF],
+                 [INF, 0, INF, 0, 2],
+                 [-1, INF, INF, INF, 0]]
+        for block_size in (1, 2, 3):
+            dist, pred = floyd_warshall_blocked(graph, block_size, True)
+            self.assert_paths_match(graph, dist, pred)
+
+    def test_random_graphs(self):
+        rng = random.Random(7)
+        for _ in range(40):
+            n = rng.randint(2, 12)
+            graph = random_graph(rng, n)
+            dist, pred = floyd_warshall_blocked(graph, rng.randint(1, n - 1), True)
+            self.assert_paths_match(graph, dist, pred)
+
+    def test_memmap(self):
+        graph = random_graph(random.Random(3), 9)
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [os.path.join(tmp, name) for name in ("in", "dist", "pred")]
+            np.array(graph, dtype=np.float64).tofile(paths[0])
+            dist, pred = floyd_warshall_memmap(paths[0], paths[1], 9, 4, paths[2])
+            self.assert_paths_match(graph, np.array(dist), np.array(pred))
+            del dist, pred
+
+
+class TestReconstructPath(unittest.TestCase):
+    def test_cycle_raises(self):
+        pred = np.array([[NO_PREDECESSOR, 2, 1], [1, NO_PREDECESSOR, 1], [2, 2, NO_PREDECESSOR]])
+        with self.assertRaises(ValueError):
+            reconstruct_path(pred, 0, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()